@@ -173,11 +173,18 @@ generators = {
         'outputs': [
             'src/compiler/translator/tree_util/BuiltIn_autogen.h',
             'src/compiler/translator/builtin_symbols_hash_autogen.txt',
+            'src/compiler/translator/builtin_symbols_output_hash_autogen.txt',
             'src/compiler/translator/ParseContext_autogen.h',
             'src/compiler/translator/SymbolTable_autogen.cpp',
             'src/compiler/translator/SymbolTable_autogen.h',
             'src/tests/compiler_tests/ImmutableString_test_autogen.cpp',
         ],
+        # The generator leaves unchanged outputs untouched, so only these files are guaranteed to be
+        # newer than the inputs after it has run.
+        'stamps': [
+            'src/compiler/translator/builtin_symbols_hash_autogen.txt',
+            'src/compiler/translator/builtin_symbols_output_hash_autogen.txt',
+        ],
         'script': 'src/compiler/translator/gen_builtin_symbols.py',
     },
 }
@@ -193,13 +200,15 @@ for name, info in sorted(generators.iteritems()):
     script = info['script']
     dirty = False
 
+    for foutput in info['outputs']:
+        if not os.path.exists(foutput):
+            print('Output ' + foutput + ' not found for ' + name + ' table')
+            dirty = True
+
     for finput in info['inputs'] + [script]:
         input_mtime = os.path.getmtime(finput)
-        for foutput in info['outputs']:
-            if not os.path.exists(foutput):
-                print('Output ' + foutput + ' not found for ' + name + ' table')
-                dirty = True
-            else:
+        for foutput in info.get('stamps', info['outputs']):
+            if os.path.exists(foutput):
                 output_mtime = os.path.getmtime(foutput)
                 if input_mtime > output_mtime:
                     dirty = True
@@ -43,12 +43,12 @@ bool isAtomicMemory(const TFunction *func)
     int id = func->uniqueId().get();
     return id >= 853 && id <= 870;
 }
-bool isImageLoad(const TFunction *func)
+bool isImageStore(const TFunction *func)
 {
     int id = func->uniqueId().get();
     return id >= 895 && id <= 906;
 }
-bool isImageStore(const TFunction *func)
+bool isImageLoad(const TFunction *func)
 {
     int id = func->uniqueId().get();
     return id >= 907 && id <= 918;
@@ -860,18 +860,6 @@ constexpr const TSymbolUniqueId BuiltInId::imageSize_UImage2DArray1;
 constexpr const TSymbolUniqueId BuiltInId::imageSize_ImageCube1;
 constexpr const TSymbolUniqueId BuiltInId::imageSize_IImageCube1;
 constexpr const TSymbolUniqueId BuiltInId::imageSize_UImageCube1;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_Image2D1_Int2;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImage2D1_Int2;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImage2D1_Int2;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_Image3D1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImage3D1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImage3D1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_Image2DArray1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImage2DArray1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImage2DArray1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_ImageCube1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImageCube1_Int3;
-constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImageCube1_Int3;
 constexpr const TSymbolUniqueId BuiltInId::imageStore_Image2D1_Int2_Float4;
 constexpr const TSymbolUniqueId BuiltInId::imageStore_IImage2D1_Int2_Int4;
 constexpr const TSymbolUniqueId BuiltInId::imageStore_UImage2D1_Int2_UInt4;
@@ -884,6 +872,18 @@ constexpr const TSymbolUniqueId BuiltInId::imageStore_UImage2DArray1_Int3_UInt4;
 constexpr const TSymbolUniqueId BuiltInId::imageStore_ImageCube1_Int3_Float4;
 constexpr const TSymbolUniqueId BuiltInId::imageStore_IImageCube1_Int3_Int4;
 constexpr const TSymbolUniqueId BuiltInId::imageStore_UImageCube1_Int3_UInt4;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_Image2D1_Int2;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImage2D1_Int2;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImage2D1_Int2;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_Image3D1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImage3D1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImage3D1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_Image2DArray1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImage2DArray1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImage2DArray1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_ImageCube1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_IImageCube1_Int3;
+constexpr const TSymbolUniqueId BuiltInId::imageLoad_UImageCube1_Int3;
 constexpr const TSymbolUniqueId BuiltInId::memoryBarrier;
 constexpr const TSymbolUniqueId BuiltInId::memoryBarrierAtomicCounter;
 constexpr const TSymbolUniqueId BuiltInId::memoryBarrierBuffer;
@@ -2657,7 +2657,7 @@ constexpr const TFunction kFunction_radians_0B(
     BuiltInId::radians_Float1,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRadians,
@@ -2666,7 +2666,7 @@ constexpr const TFunction kFunction_radians_1B(
     BuiltInId::radians_Float2,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRadians,
@@ -2675,7 +2675,7 @@ constexpr const TFunction kFunction_radians_2B(
     BuiltInId::radians_Float3,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRadians,
@@ -2684,7 +2684,7 @@ constexpr const TFunction kFunction_radians_3B(
     BuiltInId::radians_Float4,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRadians,
@@ -2693,7 +2693,7 @@ constexpr const TFunction kFunction_degrees_0B(
     BuiltInId::degrees_Float1,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDegrees,
@@ -2702,7 +2702,7 @@ constexpr const TFunction kFunction_degrees_1B(
     BuiltInId::degrees_Float2,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDegrees,
@@ -2711,7 +2711,7 @@ constexpr const TFunction kFunction_degrees_2B(
     BuiltInId::degrees_Float3,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDegrees,
@@ -2720,7 +2720,7 @@ constexpr const TFunction kFunction_degrees_3B(
     BuiltInId::degrees_Float4,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDegrees,
@@ -2729,7 +2729,7 @@ constexpr const TFunction kFunction_sin_0B(
     BuiltInId::sin_Float1,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSin,
@@ -2738,7 +2738,7 @@ constexpr const TFunction kFunction_sin_1B(
     BuiltInId::sin_Float2,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSin,
@@ -2747,7 +2747,7 @@ constexpr const TFunction kFunction_sin_2B(
     BuiltInId::sin_Float3,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSin,
@@ -2756,7 +2756,7 @@ constexpr const TFunction kFunction_sin_3B(
     BuiltInId::sin_Float4,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSin,
@@ -2765,7 +2765,7 @@ constexpr const TFunction kFunction_cos_0B(
     BuiltInId::cos_Float1,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCos,
@@ -2774,7 +2774,7 @@ constexpr const TFunction kFunction_cos_1B(
     BuiltInId::cos_Float2,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCos,
@@ -2783,7 +2783,7 @@ constexpr const TFunction kFunction_cos_2B(
     BuiltInId::cos_Float3,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCos,
@@ -2792,7 +2792,7 @@ constexpr const TFunction kFunction_cos_3B(
     BuiltInId::cos_Float4,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCos,
@@ -2801,7 +2801,7 @@ constexpr const TFunction kFunction_tan_0B(
     BuiltInId::tan_Float1,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpTan,
@@ -2810,7 +2810,7 @@ constexpr const TFunction kFunction_tan_1B(
     BuiltInId::tan_Float2,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpTan,
@@ -2819,7 +2819,7 @@ constexpr const TFunction kFunction_tan_2B(
     BuiltInId::tan_Float3,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpTan,
@@ -2828,7 +2828,7 @@ constexpr const TFunction kFunction_tan_3B(
     BuiltInId::tan_Float4,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpTan,
@@ -2837,7 +2837,7 @@ constexpr const TFunction kFunction_asin_0B(
     BuiltInId::asin_Float1,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAsin,
@@ -2846,7 +2846,7 @@ constexpr const TFunction kFunction_asin_1B(
     BuiltInId::asin_Float2,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAsin,
@@ -2855,7 +2855,7 @@ constexpr const TFunction kFunction_asin_2B(
     BuiltInId::asin_Float3,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAsin,
@@ -2864,7 +2864,7 @@ constexpr const TFunction kFunction_asin_3B(
     BuiltInId::asin_Float4,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAsin,
@@ -2873,7 +2873,7 @@ constexpr const TFunction kFunction_acos_0B(
     BuiltInId::acos_Float1,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAcos,
@@ -2882,7 +2882,7 @@ constexpr const TFunction kFunction_acos_1B(
     BuiltInId::acos_Float2,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAcos,
@@ -2891,7 +2891,7 @@ constexpr const TFunction kFunction_acos_2B(
     BuiltInId::acos_Float3,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAcos,
@@ -2900,7 +2900,7 @@ constexpr const TFunction kFunction_acos_3B(
     BuiltInId::acos_Float4,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAcos,
@@ -2909,7 +2909,7 @@ constexpr const TFunction kFunction_atan_0B0B(
     BuiltInId::atan_Float1_Float1,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAtan,
@@ -2936,7 +2936,7 @@ constexpr const TFunction kFunction_atan_3B3B(
     BuiltInId::atan_Float4_Float4,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAtan,
@@ -2945,7 +2945,7 @@ constexpr const TFunction kFunction_atan_0B(
     BuiltInId::atan_Float1,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAtan,
@@ -2954,7 +2954,7 @@ constexpr const TFunction kFunction_atan_1B(
     BuiltInId::atan_Float2,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAtan,
@@ -2963,7 +2963,7 @@ constexpr const TFunction kFunction_atan_2B(
     BuiltInId::atan_Float3,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAtan,
@@ -2972,7 +2972,7 @@ constexpr const TFunction kFunction_atan_3B(
     BuiltInId::atan_Float4,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAtan,
@@ -2981,7 +2981,7 @@ constexpr const TFunction kFunction_sinh_0B(
     BuiltInId::sinh_Float1,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSinh,
@@ -2990,7 +2990,7 @@ constexpr const TFunction kFunction_sinh_1B(
     BuiltInId::sinh_Float2,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSinh,
@@ -2999,7 +2999,7 @@ constexpr const TFunction kFunction_sinh_2B(
     BuiltInId::sinh_Float3,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSinh,
@@ -3008,7 +3008,7 @@ constexpr const TFunction kFunction_sinh_3B(
     BuiltInId::sinh_Float4,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSinh,
@@ -3017,7 +3017,7 @@ constexpr const TFunction kFunction_cosh_0B(
     BuiltInId::cosh_Float1,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCosh,
@@ -3026,7 +3026,7 @@ constexpr const TFunction kFunction_cosh_1B(
     BuiltInId::cosh_Float2,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCosh,
@@ -3035,7 +3035,7 @@ constexpr const TFunction kFunction_cosh_2B(
     BuiltInId::cosh_Float3,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCosh,
@@ -3044,7 +3044,7 @@ constexpr const TFunction kFunction_cosh_3B(
     BuiltInId::cosh_Float4,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCosh,
@@ -3053,7 +3053,7 @@ constexpr const TFunction kFunction_tanh_0B(
     BuiltInId::tanh_Float1,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpTanh,
@@ -3062,7 +3062,7 @@ constexpr const TFunction kFunction_tanh_1B(
     BuiltInId::tanh_Float2,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpTanh,
@@ -3071,7 +3071,7 @@ constexpr const TFunction kFunction_tanh_2B(
     BuiltInId::tanh_Float3,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpTanh,
@@ -3080,7 +3080,7 @@ constexpr const TFunction kFunction_tanh_3B(
     BuiltInId::tanh_Float4,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpTanh,
@@ -3089,7 +3089,7 @@ constexpr const TFunction kFunction_asinh_0B(
     BuiltInId::asinh_Float1,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAsinh,
@@ -3098,7 +3098,7 @@ constexpr const TFunction kFunction_asinh_1B(
     BuiltInId::asinh_Float2,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAsinh,
@@ -3107,7 +3107,7 @@ constexpr const TFunction kFunction_asinh_2B(
     BuiltInId::asinh_Float3,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAsinh,
@@ -3116,7 +3116,7 @@ constexpr const TFunction kFunction_asinh_3B(
     BuiltInId::asinh_Float4,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAsinh,
@@ -3125,7 +3125,7 @@ constexpr const TFunction kFunction_acosh_0B(
     BuiltInId::acosh_Float1,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAcosh,
@@ -3134,7 +3134,7 @@ constexpr const TFunction kFunction_acosh_1B(
     BuiltInId::acosh_Float2,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAcosh,
@@ -3143,7 +3143,7 @@ constexpr const TFunction kFunction_acosh_2B(
     BuiltInId::acosh_Float3,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAcosh,
@@ -3152,7 +3152,7 @@ constexpr const TFunction kFunction_acosh_3B(
     BuiltInId::acosh_Float4,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAcosh,
@@ -3161,7 +3161,7 @@ constexpr const TFunction kFunction_atanh_0B(
     BuiltInId::atanh_Float1,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAtanh,
@@ -3170,7 +3170,7 @@ constexpr const TFunction kFunction_atanh_1B(
     BuiltInId::atanh_Float2,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAtanh,
@@ -3179,7 +3179,7 @@ constexpr const TFunction kFunction_atanh_2B(
     BuiltInId::atanh_Float3,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAtanh,
@@ -3188,7 +3188,7 @@ constexpr const TFunction kFunction_atanh_3B(
     BuiltInId::atanh_Float4,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAtanh,
@@ -3197,7 +3197,7 @@ constexpr const TFunction kFunction_pow_0B0B(
     BuiltInId::pow_Float1_Float1,
     BuiltInName::pow,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPow,
@@ -3224,7 +3224,7 @@ constexpr const TFunction kFunction_pow_3B3B(
     BuiltInId::pow_Float4_Float4,
     BuiltInName::pow,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpPow,
@@ -3233,7 +3233,7 @@ constexpr const TFunction kFunction_exp_0B(
     BuiltInId::exp_Float1,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpExp,
@@ -3242,7 +3242,7 @@ constexpr const TFunction kFunction_exp_1B(
     BuiltInId::exp_Float2,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpExp,
@@ -3251,7 +3251,7 @@ constexpr const TFunction kFunction_exp_2B(
     BuiltInId::exp_Float3,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpExp,
@@ -3260,7 +3260,7 @@ constexpr const TFunction kFunction_exp_3B(
     BuiltInId::exp_Float4,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpExp,
@@ -3269,7 +3269,7 @@ constexpr const TFunction kFunction_log_0B(
     BuiltInId::log_Float1,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLog,
@@ -3278,7 +3278,7 @@ constexpr const TFunction kFunction_log_1B(
     BuiltInId::log_Float2,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLog,
@@ -3287,7 +3287,7 @@ constexpr const TFunction kFunction_log_2B(
     BuiltInId::log_Float3,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLog,
@@ -3296,7 +3296,7 @@ constexpr const TFunction kFunction_log_3B(
     BuiltInId::log_Float4,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLog,
@@ -3305,7 +3305,7 @@ constexpr const TFunction kFunction_exp2_0B(
     BuiltInId::exp2_Float1,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpExp2,
@@ -3314,7 +3314,7 @@ constexpr const TFunction kFunction_exp2_1B(
     BuiltInId::exp2_Float2,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpExp2,
@@ -3323,7 +3323,7 @@ constexpr const TFunction kFunction_exp2_2B(
     BuiltInId::exp2_Float3,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpExp2,
@@ -3332,7 +3332,7 @@ constexpr const TFunction kFunction_exp2_3B(
     BuiltInId::exp2_Float4,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpExp2,
@@ -3341,7 +3341,7 @@ constexpr const TFunction kFunction_log2_0B(
     BuiltInId::log2_Float1,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLog2,
@@ -3350,7 +3350,7 @@ constexpr const TFunction kFunction_log2_1B(
     BuiltInId::log2_Float2,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLog2,
@@ -3359,7 +3359,7 @@ constexpr const TFunction kFunction_log2_2B(
     BuiltInId::log2_Float3,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLog2,
@@ -3368,7 +3368,7 @@ constexpr const TFunction kFunction_log2_3B(
     BuiltInId::log2_Float4,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLog2,
@@ -3377,7 +3377,7 @@ constexpr const TFunction kFunction_sqrt_0B(
     BuiltInId::sqrt_Float1,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSqrt,
@@ -3386,7 +3386,7 @@ constexpr const TFunction kFunction_sqrt_1B(
     BuiltInId::sqrt_Float2,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSqrt,
@@ -3395,7 +3395,7 @@ constexpr const TFunction kFunction_sqrt_2B(
     BuiltInId::sqrt_Float3,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSqrt,
@@ -3404,7 +3404,7 @@ constexpr const TFunction kFunction_sqrt_3B(
     BuiltInId::sqrt_Float4,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSqrt,
@@ -3413,7 +3413,7 @@ constexpr const TFunction kFunction_inversesqrt_0B(
     BuiltInId::inversesqrt_Float1,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpInversesqrt,
@@ -3422,7 +3422,7 @@ constexpr const TFunction kFunction_inversesqrt_1B(
     BuiltInId::inversesqrt_Float2,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpInversesqrt,
@@ -3431,7 +3431,7 @@ constexpr const TFunction kFunction_inversesqrt_2B(
     BuiltInId::inversesqrt_Float3,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpInversesqrt,
@@ -3440,7 +3440,7 @@ constexpr const TFunction kFunction_inversesqrt_3B(
     BuiltInId::inversesqrt_Float4,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpInversesqrt,
@@ -3449,7 +3449,7 @@ constexpr const TFunction kFunction_abs_0B(
     BuiltInId::abs_Float1,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAbs,
@@ -3458,7 +3458,7 @@ constexpr const TFunction kFunction_abs_1B(
     BuiltInId::abs_Float2,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAbs,
@@ -3467,7 +3467,7 @@ constexpr const TFunction kFunction_abs_2B(
     BuiltInId::abs_Float3,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAbs,
@@ -3476,7 +3476,7 @@ constexpr const TFunction kFunction_abs_3B(
     BuiltInId::abs_Float4,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAbs,
@@ -3492,7 +3492,7 @@ constexpr const TFunction kFunction_abs_0C(BuiltInId::abs_Int1,
 constexpr const TFunction kFunction_abs_1C(BuiltInId::abs_Int2,
                                            BuiltInName::abs,
                                            TExtension::UNDEFINED,
-                                           BuiltInParameters::p1C1C0C0C,
+                                           BuiltInParameters::p1C1C_o_1C_o_1C,
                                            1,
                                            StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
                                            EOpAbs,
@@ -3500,7 +3500,7 @@ constexpr const TFunction kFunction_abs_1C(BuiltInId::abs_Int2,
 constexpr const TFunction kFunction_abs_2C(BuiltInId::abs_Int3,
                                            BuiltInName::abs,
                                            TExtension::UNDEFINED,
-                                           BuiltInParameters::p2C2C0C0C,
+                                           BuiltInParameters::p2C2C_o_2C_o_2C,
                                            1,
                                            StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
                                            EOpAbs,
@@ -3508,7 +3508,7 @@ constexpr const TFunction kFunction_abs_2C(BuiltInId::abs_Int3,
 constexpr const TFunction kFunction_abs_3C(BuiltInId::abs_Int4,
                                            BuiltInName::abs,
                                            TExtension::UNDEFINED,
-                                           BuiltInParameters::p3C0C0C,
+                                           BuiltInParameters::p3C3C_o_3C_o_3C,
                                            1,
                                            StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
                                            EOpAbs,
@@ -3517,7 +3517,7 @@ constexpr const TFunction kFunction_sign_0B(
     BuiltInId::sign_Float1,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSign,
@@ -3526,7 +3526,7 @@ constexpr const TFunction kFunction_sign_1B(
     BuiltInId::sign_Float2,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSign,
@@ -3535,7 +3535,7 @@ constexpr const TFunction kFunction_sign_2B(
     BuiltInId::sign_Float3,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSign,
@@ -3544,7 +3544,7 @@ constexpr const TFunction kFunction_sign_3B(
     BuiltInId::sign_Float4,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSign,
@@ -3562,7 +3562,7 @@ constexpr const TFunction kFunction_sign_1C(
     BuiltInId::sign_Int2,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSign,
@@ -3571,7 +3571,7 @@ constexpr const TFunction kFunction_sign_2C(
     BuiltInId::sign_Int3,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSign,
@@ -3580,7 +3580,7 @@ constexpr const TFunction kFunction_sign_3C(
     BuiltInId::sign_Int4,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSign,
@@ -3589,7 +3589,7 @@ constexpr const TFunction kFunction_floor_0B(
     BuiltInId::floor_Float1,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFloor,
@@ -3598,7 +3598,7 @@ constexpr const TFunction kFunction_floor_1B(
     BuiltInId::floor_Float2,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFloor,
@@ -3607,7 +3607,7 @@ constexpr const TFunction kFunction_floor_2B(
     BuiltInId::floor_Float3,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFloor,
@@ -3616,7 +3616,7 @@ constexpr const TFunction kFunction_floor_3B(
     BuiltInId::floor_Float4,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFloor,
@@ -3625,7 +3625,7 @@ constexpr const TFunction kFunction_trunc_0B(
     BuiltInId::trunc_Float1,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpTrunc,
@@ -3634,7 +3634,7 @@ constexpr const TFunction kFunction_trunc_1B(
     BuiltInId::trunc_Float2,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpTrunc,
@@ -3643,7 +3643,7 @@ constexpr const TFunction kFunction_trunc_2B(
     BuiltInId::trunc_Float3,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpTrunc,
@@ -3652,7 +3652,7 @@ constexpr const TFunction kFunction_trunc_3B(
     BuiltInId::trunc_Float4,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpTrunc,
@@ -3661,7 +3661,7 @@ constexpr const TFunction kFunction_round_0B(
     BuiltInId::round_Float1,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRound,
@@ -3670,7 +3670,7 @@ constexpr const TFunction kFunction_round_1B(
     BuiltInId::round_Float2,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRound,
@@ -3679,7 +3679,7 @@ constexpr const TFunction kFunction_round_2B(
     BuiltInId::round_Float3,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRound,
@@ -3688,7 +3688,7 @@ constexpr const TFunction kFunction_round_3B(
     BuiltInId::round_Float4,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRound,
@@ -3697,7 +3697,7 @@ constexpr const TFunction kFunction_roundEven_0B(
     BuiltInId::roundEven_Float1,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRoundEven,
@@ -3706,7 +3706,7 @@ constexpr const TFunction kFunction_roundEven_1B(
     BuiltInId::roundEven_Float2,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRoundEven,
@@ -3715,7 +3715,7 @@ constexpr const TFunction kFunction_roundEven_2B(
     BuiltInId::roundEven_Float3,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRoundEven,
@@ -3724,7 +3724,7 @@ constexpr const TFunction kFunction_roundEven_3B(
     BuiltInId::roundEven_Float4,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRoundEven,
@@ -3733,7 +3733,7 @@ constexpr const TFunction kFunction_ceil_0B(
     BuiltInId::ceil_Float1,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCeil,
@@ -3742,7 +3742,7 @@ constexpr const TFunction kFunction_ceil_1B(
     BuiltInId::ceil_Float2,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCeil,
@@ -3751,7 +3751,7 @@ constexpr const TFunction kFunction_ceil_2B(
     BuiltInId::ceil_Float3,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCeil,
@@ -3760,7 +3760,7 @@ constexpr const TFunction kFunction_ceil_3B(
     BuiltInId::ceil_Float4,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCeil,
@@ -3769,7 +3769,7 @@ constexpr const TFunction kFunction_fract_0B(
     BuiltInId::fract_Float1,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFract,
@@ -3778,7 +3778,7 @@ constexpr const TFunction kFunction_fract_1B(
     BuiltInId::fract_Float2,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFract,
@@ -3787,7 +3787,7 @@ constexpr const TFunction kFunction_fract_2B(
     BuiltInId::fract_Float3,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFract,
@@ -3796,7 +3796,7 @@ constexpr const TFunction kFunction_fract_3B(
     BuiltInId::fract_Float4,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFract,
@@ -3805,7 +3805,7 @@ constexpr const TFunction kFunction_mod_0B0B(
     BuiltInId::mod_Float1_Float1,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMod,
@@ -3859,7 +3859,7 @@ constexpr const TFunction kFunction_mod_3B3B(
     BuiltInId::mod_Float4_Float4,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMod,
@@ -3868,7 +3868,7 @@ constexpr const TFunction kFunction_min_0B0B(
     BuiltInId::min_Float1_Float1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMin,
@@ -3922,7 +3922,7 @@ constexpr const TFunction kFunction_min_3B3B(
     BuiltInId::min_Float4_Float4,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMin,
@@ -3940,7 +3940,7 @@ constexpr const TFunction kFunction_min_1C1C(
     BuiltInId::min_Int2_Int2,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMin,
@@ -3949,7 +3949,7 @@ constexpr const TFunction kFunction_min_2C2C(
     BuiltInId::min_Int3_Int3,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMin,
@@ -3958,7 +3958,7 @@ constexpr const TFunction kFunction_min_3C3C(
     BuiltInId::min_Int4_Int4,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMin,
@@ -3994,7 +3994,7 @@ constexpr const TFunction kFunction_min_0D0D(
     BuiltInId::min_UInt1_UInt1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMin,
@@ -4003,7 +4003,7 @@ constexpr const TFunction kFunction_min_1D1D(
     BuiltInId::min_UInt2_UInt2,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMin,
@@ -4012,7 +4012,7 @@ constexpr const TFunction kFunction_min_2D2D(
     BuiltInId::min_UInt3_UInt3,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMin,
@@ -4021,7 +4021,7 @@ constexpr const TFunction kFunction_min_3D3D(
     BuiltInId::min_UInt4_UInt4,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMin,
@@ -4057,7 +4057,7 @@ constexpr const TFunction kFunction_max_0B0B(
     BuiltInId::max_Float1_Float1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMax,
@@ -4111,7 +4111,7 @@ constexpr const TFunction kFunction_max_3B3B(
     BuiltInId::max_Float4_Float4,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMax,
@@ -4129,7 +4129,7 @@ constexpr const TFunction kFunction_max_1C1C(
     BuiltInId::max_Int2_Int2,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMax,
@@ -4138,7 +4138,7 @@ constexpr const TFunction kFunction_max_2C2C(
     BuiltInId::max_Int3_Int3,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMax,
@@ -4147,7 +4147,7 @@ constexpr const TFunction kFunction_max_3C3C(
     BuiltInId::max_Int4_Int4,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMax,
@@ -4183,7 +4183,7 @@ constexpr const TFunction kFunction_max_0D0D(
     BuiltInId::max_UInt1_UInt1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMax,
@@ -4192,7 +4192,7 @@ constexpr const TFunction kFunction_max_1D1D(
     BuiltInId::max_UInt2_UInt2,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMax,
@@ -4201,7 +4201,7 @@ constexpr const TFunction kFunction_max_2D2D(
     BuiltInId::max_UInt3_UInt3,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMax,
@@ -4210,7 +4210,7 @@ constexpr const TFunction kFunction_max_3D3D(
     BuiltInId::max_UInt4_UInt4,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMax,
@@ -4534,7 +4534,7 @@ constexpr const TFunction kFunction_step_0B0B(
     BuiltInId::step_Float1_Float1,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpStep,
@@ -4561,7 +4561,7 @@ constexpr const TFunction kFunction_step_3B3B(
     BuiltInId::step_Float4_Float4,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpStep,
@@ -4696,7 +4696,7 @@ constexpr const TFunction kFunction_isnan_0B(
     BuiltInId::isnan_Float1,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpIsnan,
@@ -4705,7 +4705,7 @@ constexpr const TFunction kFunction_isnan_1B(
     BuiltInId::isnan_Float2,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIsnan,
@@ -4714,7 +4714,7 @@ constexpr const TFunction kFunction_isnan_2B(
     BuiltInId::isnan_Float3,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIsnan,
@@ -4723,7 +4723,7 @@ constexpr const TFunction kFunction_isnan_3B(
     BuiltInId::isnan_Float4,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIsnan,
@@ -4732,7 +4732,7 @@ constexpr const TFunction kFunction_isinf_0B(
     BuiltInId::isinf_Float1,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpIsinf,
@@ -4741,7 +4741,7 @@ constexpr const TFunction kFunction_isinf_1B(
     BuiltInId::isinf_Float2,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIsinf,
@@ -4750,7 +4750,7 @@ constexpr const TFunction kFunction_isinf_2B(
     BuiltInId::isinf_Float3,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIsinf,
@@ -4759,7 +4759,7 @@ constexpr const TFunction kFunction_isinf_3B(
     BuiltInId::isinf_Float4,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIsinf,
@@ -4768,7 +4768,7 @@ constexpr const TFunction kFunction_floatBitsToInt_0B(
     BuiltInId::floatBitsToInt_Float1,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFloatBitsToInt,
@@ -4777,7 +4777,7 @@ constexpr const TFunction kFunction_floatBitsToInt_1B(
     BuiltInId::floatBitsToInt_Float2,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFloatBitsToInt,
@@ -4786,7 +4786,7 @@ constexpr const TFunction kFunction_floatBitsToInt_2B(
     BuiltInId::floatBitsToInt_Float3,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFloatBitsToInt,
@@ -4795,7 +4795,7 @@ constexpr const TFunction kFunction_floatBitsToInt_3B(
     BuiltInId::floatBitsToInt_Float4,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFloatBitsToInt,
@@ -4804,7 +4804,7 @@ constexpr const TFunction kFunction_floatBitsToUint_0B(
     BuiltInId::floatBitsToUint_Float1,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFloatBitsToUint,
@@ -4813,7 +4813,7 @@ constexpr const TFunction kFunction_floatBitsToUint_1B(
     BuiltInId::floatBitsToUint_Float2,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFloatBitsToUint,
@@ -4822,7 +4822,7 @@ constexpr const TFunction kFunction_floatBitsToUint_2B(
     BuiltInId::floatBitsToUint_Float3,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFloatBitsToUint,
@@ -4831,7 +4831,7 @@ constexpr const TFunction kFunction_floatBitsToUint_3B(
     BuiltInId::floatBitsToUint_Float4,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFloatBitsToUint,
@@ -4849,7 +4849,7 @@ constexpr const TFunction kFunction_intBitsToFloat_1C(
     BuiltInId::intBitsToFloat_Int2,
     BuiltInName::intBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIntBitsToFloat,
@@ -4858,7 +4858,7 @@ constexpr const TFunction kFunction_intBitsToFloat_2C(
     BuiltInId::intBitsToFloat_Int3,
     BuiltInName::intBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIntBitsToFloat,
@@ -4867,7 +4867,7 @@ constexpr const TFunction kFunction_intBitsToFloat_3C(
     BuiltInId::intBitsToFloat_Int4,
     BuiltInName::intBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIntBitsToFloat,
@@ -4876,7 +4876,7 @@ constexpr const TFunction kFunction_uintBitsToFloat_0D(
     BuiltInId::uintBitsToFloat_UInt1,
     BuiltInName::uintBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpUintBitsToFloat,
@@ -4885,7 +4885,7 @@ constexpr const TFunction kFunction_uintBitsToFloat_1D(
     BuiltInId::uintBitsToFloat_UInt2,
     BuiltInName::uintBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUintBitsToFloat,
@@ -4894,7 +4894,7 @@ constexpr const TFunction kFunction_uintBitsToFloat_2D(
     BuiltInId::uintBitsToFloat_UInt3,
     BuiltInName::uintBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpUintBitsToFloat,
@@ -4903,7 +4903,7 @@ constexpr const TFunction kFunction_uintBitsToFloat_3D(
     BuiltInId::uintBitsToFloat_UInt4,
     BuiltInName::uintBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpUintBitsToFloat,
@@ -4984,7 +4984,7 @@ constexpr const TFunction kFunction_packSnorm2x16_1B(
     BuiltInId::packSnorm2x16_Float2,
     BuiltInName::packSnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackSnorm2x16,
@@ -4993,7 +4993,7 @@ constexpr const TFunction kFunction_packUnorm2x16_1B(
     BuiltInId::packUnorm2x16_Float2,
     BuiltInName::packUnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackUnorm2x16,
@@ -5002,7 +5002,7 @@ constexpr const TFunction kFunction_packHalf2x16_1B(
     BuiltInId::packHalf2x16_Float2,
     BuiltInName::packHalf2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackHalf2x16,
@@ -5011,7 +5011,7 @@ constexpr const TFunction kFunction_unpackSnorm2x16_0D(
     BuiltInId::unpackSnorm2x16_UInt1,
     BuiltInName::unpackSnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUnpackSnorm2x16,
@@ -5020,7 +5020,7 @@ constexpr const TFunction kFunction_unpackUnorm2x16_0D(
     BuiltInId::unpackUnorm2x16_UInt1,
     BuiltInName::unpackUnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUnpackUnorm2x16,
@@ -5029,7 +5029,7 @@ constexpr const TFunction kFunction_unpackHalf2x16_0D(
     BuiltInId::unpackHalf2x16_UInt1,
     BuiltInName::unpackHalf2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUnpackHalf2x16,
@@ -5038,7 +5038,7 @@ constexpr const TFunction kFunction_packUnorm4x8_3B(
     BuiltInId::packUnorm4x8_Float4,
     BuiltInName::packUnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackUnorm4x8,
@@ -5047,7 +5047,7 @@ constexpr const TFunction kFunction_packSnorm4x8_3B(
     BuiltInId::packSnorm4x8_Float4,
     BuiltInName::packSnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackSnorm4x8,
@@ -5056,7 +5056,7 @@ constexpr const TFunction kFunction_unpackUnorm4x8_0D(
     BuiltInId::unpackUnorm4x8_UInt1,
     BuiltInName::unpackUnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpUnpackUnorm4x8,
@@ -5065,7 +5065,7 @@ constexpr const TFunction kFunction_unpackSnorm4x8_0D(
     BuiltInId::unpackSnorm4x8_UInt1,
     BuiltInName::unpackSnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpUnpackSnorm4x8,
@@ -5074,7 +5074,7 @@ constexpr const TFunction kFunction_length_0B(
     BuiltInId::length_Float1,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -5083,7 +5083,7 @@ constexpr const TFunction kFunction_length_1B(
     BuiltInId::length_Float2,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -5092,7 +5092,7 @@ constexpr const TFunction kFunction_length_2B(
     BuiltInId::length_Float3,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -5101,7 +5101,7 @@ constexpr const TFunction kFunction_length_3B(
     BuiltInId::length_Float4,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -5110,7 +5110,7 @@ constexpr const TFunction kFunction_distance_0B0B(
     BuiltInId::distance_Float1_Float1,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -5137,7 +5137,7 @@ constexpr const TFunction kFunction_distance_3B3B(
     BuiltInId::distance_Float4_Float4,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -5146,7 +5146,7 @@ constexpr const TFunction kFunction_dot_0B0B(
     BuiltInId::dot_Float1_Float1,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -5173,7 +5173,7 @@ constexpr const TFunction kFunction_dot_3B3B(
     BuiltInId::dot_Float4_Float4,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -5191,7 +5191,7 @@ constexpr const TFunction kFunction_normalize_0B(
     BuiltInId::normalize_Float1,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpNormalize,
@@ -5200,7 +5200,7 @@ constexpr const TFunction kFunction_normalize_1B(
     BuiltInId::normalize_Float2,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpNormalize,
@@ -5209,7 +5209,7 @@ constexpr const TFunction kFunction_normalize_2B(
     BuiltInId::normalize_Float3,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpNormalize,
@@ -5218,7 +5218,7 @@ constexpr const TFunction kFunction_normalize_3B(
     BuiltInId::normalize_Float4,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNormalize,
@@ -5263,7 +5263,7 @@ constexpr const TFunction kFunction_reflect_0B0B(
     BuiltInId::reflect_Float1_Float1,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0B1B,
+    BuiltInParameters::p0B0B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpReflect,
@@ -5290,7 +5290,7 @@ constexpr const TFunction kFunction_reflect_3B3B(
     BuiltInId::reflect_Float4_Float4,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpReflect,
@@ -5434,7 +5434,7 @@ constexpr const TFunction kFunction_outerProduct_3B3B(
     BuiltInId::outerProduct_Float4_Float4,
     BuiltInName::outerProduct,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 4>(),
     EOpOuterProduct,
@@ -5650,7 +5650,7 @@ constexpr const TFunction kFunction_lessThan_3B3B(
     BuiltInId::lessThan_Float4_Float4,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanComponentWise,
@@ -5659,7 +5659,7 @@ constexpr const TFunction kFunction_lessThan_1C1C(
     BuiltInId::lessThan_Int2_Int2,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanComponentWise,
@@ -5668,7 +5668,7 @@ constexpr const TFunction kFunction_lessThan_2C2C(
     BuiltInId::lessThan_Int3_Int3,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLessThanComponentWise,
@@ -5677,7 +5677,7 @@ constexpr const TFunction kFunction_lessThan_3C3C(
     BuiltInId::lessThan_Int4_Int4,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanComponentWise,
@@ -5686,7 +5686,7 @@ constexpr const TFunction kFunction_lessThan_1D1D(
     BuiltInId::lessThan_UInt2_UInt2,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanComponentWise,
@@ -5695,7 +5695,7 @@ constexpr const TFunction kFunction_lessThan_2D2D(
     BuiltInId::lessThan_UInt3_UInt3,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLessThanComponentWise,
@@ -5704,7 +5704,7 @@ constexpr const TFunction kFunction_lessThan_3D3D(
     BuiltInId::lessThan_UInt4_UInt4,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanComponentWise,
@@ -5731,7 +5731,7 @@ constexpr const TFunction kFunction_lessThanEqual_3B3B(
     BuiltInId::lessThanEqual_Float4_Float4,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanEqualComponentWise,
@@ -5740,7 +5740,7 @@ constexpr const TFunction kFunction_lessThanEqual_1C1C(
     BuiltInId::lessThanEqual_Int2_Int2,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanEqualComponentWise,
@@ -5749,7 +5749,7 @@ constexpr const TFunction kFunction_lessThanEqual_2C2C(
     BuiltInId::lessThanEqual_Int3_Int3,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLessThanEqualComponentWise,
@@ -5758,7 +5758,7 @@ constexpr const TFunction kFunction_lessThanEqual_3C3C(
     BuiltInId::lessThanEqual_Int4_Int4,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanEqualComponentWise,
@@ -5767,7 +5767,7 @@ constexpr const TFunction kFunction_lessThanEqual_1D1D(
     BuiltInId::lessThanEqual_UInt2_UInt2,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanEqualComponentWise,
@@ -5776,7 +5776,7 @@ constexpr const TFunction kFunction_lessThanEqual_2D2D(
     BuiltInId::lessThanEqual_UInt3_UInt3,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLessThanEqualComponentWise,
@@ -5785,7 +5785,7 @@ constexpr const TFunction kFunction_lessThanEqual_3D3D(
     BuiltInId::lessThanEqual_UInt4_UInt4,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanEqualComponentWise,
@@ -5812,7 +5812,7 @@ constexpr const TFunction kFunction_greaterThan_3B3B(
     BuiltInId::greaterThan_Float4_Float4,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanComponentWise,
@@ -5821,7 +5821,7 @@ constexpr const TFunction kFunction_greaterThan_1C1C(
     BuiltInId::greaterThan_Int2_Int2,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanComponentWise,
@@ -5830,7 +5830,7 @@ constexpr const TFunction kFunction_greaterThan_2C2C(
     BuiltInId::greaterThan_Int3_Int3,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpGreaterThanComponentWise,
@@ -5839,7 +5839,7 @@ constexpr const TFunction kFunction_greaterThan_3C3C(
     BuiltInId::greaterThan_Int4_Int4,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanComponentWise,
@@ -5848,7 +5848,7 @@ constexpr const TFunction kFunction_greaterThan_1D1D(
     BuiltInId::greaterThan_UInt2_UInt2,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanComponentWise,
@@ -5857,7 +5857,7 @@ constexpr const TFunction kFunction_greaterThan_2D2D(
     BuiltInId::greaterThan_UInt3_UInt3,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpGreaterThanComponentWise,
@@ -5866,7 +5866,7 @@ constexpr const TFunction kFunction_greaterThan_3D3D(
     BuiltInId::greaterThan_UInt4_UInt4,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanComponentWise,
@@ -5893,7 +5893,7 @@ constexpr const TFunction kFunction_greaterThanEqual_3B3B(
     BuiltInId::greaterThanEqual_Float4_Float4,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -5902,7 +5902,7 @@ constexpr const TFunction kFunction_greaterThanEqual_1C1C(
     BuiltInId::greaterThanEqual_Int2_Int2,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -5911,7 +5911,7 @@ constexpr const TFunction kFunction_greaterThanEqual_2C2C(
     BuiltInId::greaterThanEqual_Int3_Int3,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -5920,7 +5920,7 @@ constexpr const TFunction kFunction_greaterThanEqual_3C3C(
     BuiltInId::greaterThanEqual_Int4_Int4,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -5929,7 +5929,7 @@ constexpr const TFunction kFunction_greaterThanEqual_1D1D(
     BuiltInId::greaterThanEqual_UInt2_UInt2,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -5938,7 +5938,7 @@ constexpr const TFunction kFunction_greaterThanEqual_2D2D(
     BuiltInId::greaterThanEqual_UInt3_UInt3,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -5947,7 +5947,7 @@ constexpr const TFunction kFunction_greaterThanEqual_3D3D(
     BuiltInId::greaterThanEqual_UInt4_UInt4,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -5974,7 +5974,7 @@ constexpr const TFunction kFunction_equal_3B3B(
     BuiltInId::equal_Float4_Float4,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpEqualComponentWise,
@@ -5983,7 +5983,7 @@ constexpr const TFunction kFunction_equal_1C1C(
     BuiltInId::equal_Int2_Int2,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpEqualComponentWise,
@@ -5992,7 +5992,7 @@ constexpr const TFunction kFunction_equal_2C2C(
     BuiltInId::equal_Int3_Int3,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpEqualComponentWise,
@@ -6001,7 +6001,7 @@ constexpr const TFunction kFunction_equal_3C3C(
     BuiltInId::equal_Int4_Int4,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpEqualComponentWise,
@@ -6010,7 +6010,7 @@ constexpr const TFunction kFunction_equal_1D1D(
     BuiltInId::equal_UInt2_UInt2,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpEqualComponentWise,
@@ -6019,7 +6019,7 @@ constexpr const TFunction kFunction_equal_2D2D(
     BuiltInId::equal_UInt3_UInt3,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpEqualComponentWise,
@@ -6028,7 +6028,7 @@ constexpr const TFunction kFunction_equal_3D3D(
     BuiltInId::equal_UInt4_UInt4,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpEqualComponentWise,
@@ -6082,7 +6082,7 @@ constexpr const TFunction kFunction_notEqual_3B3B(
     BuiltInId::notEqual_Float4_Float4,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B3B3B,
+    BuiltInParameters::p3B3B0B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNotEqualComponentWise,
@@ -6091,7 +6091,7 @@ constexpr const TFunction kFunction_notEqual_1C1C(
     BuiltInId::notEqual_Int2_Int2,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpNotEqualComponentWise,
@@ -6100,7 +6100,7 @@ constexpr const TFunction kFunction_notEqual_2C2C(
     BuiltInId::notEqual_Int3_Int3,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpNotEqualComponentWise,
@@ -6109,7 +6109,7 @@ constexpr const TFunction kFunction_notEqual_3C3C(
     BuiltInId::notEqual_Int4_Int4,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNotEqualComponentWise,
@@ -6118,7 +6118,7 @@ constexpr const TFunction kFunction_notEqual_1D1D(
     BuiltInId::notEqual_UInt2_UInt2,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpNotEqualComponentWise,
@@ -6127,7 +6127,7 @@ constexpr const TFunction kFunction_notEqual_2D2D(
     BuiltInId::notEqual_UInt3_UInt3,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpNotEqualComponentWise,
@@ -6136,7 +6136,7 @@ constexpr const TFunction kFunction_notEqual_3D3D(
     BuiltInId::notEqual_UInt4_UInt4,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNotEqualComponentWise,
@@ -6406,7 +6406,7 @@ constexpr const TFunction kFunction_bitfieldReverse_1C(
     BuiltInId::bitfieldReverse_Int2,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitfieldReverse,
@@ -6415,7 +6415,7 @@ constexpr const TFunction kFunction_bitfieldReverse_2C(
     BuiltInId::bitfieldReverse_Int3,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitfieldReverse,
@@ -6424,7 +6424,7 @@ constexpr const TFunction kFunction_bitfieldReverse_3C(
     BuiltInId::bitfieldReverse_Int4,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitfieldReverse,
@@ -6433,7 +6433,7 @@ constexpr const TFunction kFunction_bitfieldReverse_0D(
     BuiltInId::bitfieldReverse_UInt1,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitfieldReverse,
@@ -6442,7 +6442,7 @@ constexpr const TFunction kFunction_bitfieldReverse_1D(
     BuiltInId::bitfieldReverse_UInt2,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitfieldReverse,
@@ -6451,7 +6451,7 @@ constexpr const TFunction kFunction_bitfieldReverse_2D(
     BuiltInId::bitfieldReverse_UInt3,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitfieldReverse,
@@ -6460,7 +6460,7 @@ constexpr const TFunction kFunction_bitfieldReverse_3D(
     BuiltInId::bitfieldReverse_UInt4,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitfieldReverse,
@@ -6478,7 +6478,7 @@ constexpr const TFunction kFunction_bitCount_1C(
     BuiltInId::bitCount_Int2,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitCount,
@@ -6487,7 +6487,7 @@ constexpr const TFunction kFunction_bitCount_2C(
     BuiltInId::bitCount_Int3,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitCount,
@@ -6496,7 +6496,7 @@ constexpr const TFunction kFunction_bitCount_3C(
     BuiltInId::bitCount_Int4,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitCount,
@@ -6505,7 +6505,7 @@ constexpr const TFunction kFunction_bitCount_0D(
     BuiltInId::bitCount_UInt1,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitCount,
@@ -6514,7 +6514,7 @@ constexpr const TFunction kFunction_bitCount_1D(
     BuiltInId::bitCount_UInt2,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitCount,
@@ -6523,7 +6523,7 @@ constexpr const TFunction kFunction_bitCount_2D(
     BuiltInId::bitCount_UInt3,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitCount,
@@ -6532,7 +6532,7 @@ constexpr const TFunction kFunction_bitCount_3D(
     BuiltInId::bitCount_UInt4,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitCount,
@@ -6550,7 +6550,7 @@ constexpr const TFunction kFunction_findLSB_1C(
     BuiltInId::findLSB_Int2,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFindLSB,
@@ -6559,7 +6559,7 @@ constexpr const TFunction kFunction_findLSB_2C(
     BuiltInId::findLSB_Int3,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFindLSB,
@@ -6568,7 +6568,7 @@ constexpr const TFunction kFunction_findLSB_3C(
     BuiltInId::findLSB_Int4,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindLSB,
@@ -6577,7 +6577,7 @@ constexpr const TFunction kFunction_findLSB_0D(
     BuiltInId::findLSB_UInt1,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFindLSB,
@@ -6586,7 +6586,7 @@ constexpr const TFunction kFunction_findLSB_1D(
     BuiltInId::findLSB_UInt2,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFindLSB,
@@ -6595,7 +6595,7 @@ constexpr const TFunction kFunction_findLSB_2D(
     BuiltInId::findLSB_UInt3,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFindLSB,
@@ -6604,7 +6604,7 @@ constexpr const TFunction kFunction_findLSB_3D(
     BuiltInId::findLSB_UInt4,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindLSB,
@@ -6622,7 +6622,7 @@ constexpr const TFunction kFunction_findMSB_1C(
     BuiltInId::findMSB_Int2,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1C1C0C0C,
+    BuiltInParameters::p1C1C_o_1C_o_1C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFindMSB,
@@ -6631,7 +6631,7 @@ constexpr const TFunction kFunction_findMSB_2C(
     BuiltInId::findMSB_Int3,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2C2C0C0C,
+    BuiltInParameters::p2C2C_o_2C_o_2C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFindMSB,
@@ -6640,7 +6640,7 @@ constexpr const TFunction kFunction_findMSB_3C(
     BuiltInId::findMSB_Int4,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3C0C0C,
+    BuiltInParameters::p3C3C_o_3C_o_3C,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindMSB,
@@ -6649,7 +6649,7 @@ constexpr const TFunction kFunction_findMSB_0D(
     BuiltInId::findMSB_UInt1,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0D0C0C,
+    BuiltInParameters::p0D0D_o_0D_o_0D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFindMSB,
@@ -6658,7 +6658,7 @@ constexpr const TFunction kFunction_findMSB_1D(
     BuiltInId::findMSB_UInt2,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1D0C0C,
+    BuiltInParameters::p1D1D_o_1D_o_1D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFindMSB,
@@ -6667,7 +6667,7 @@ constexpr const TFunction kFunction_findMSB_2D(
     BuiltInId::findMSB_UInt3,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2D2D0C0C,
+    BuiltInParameters::p2D2D_o_2D_o_2D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFindMSB,
@@ -6676,7 +6676,7 @@ constexpr const TFunction kFunction_findMSB_3D(
     BuiltInId::findMSB_UInt4,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3D0C0C,
+    BuiltInParameters::p3D3D_o_3D_o_3D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindMSB,
@@ -6838,7 +6838,7 @@ constexpr const TFunction kFunction_texture2DProj_0H2B(
     BuiltInId::texture2DProj_Sampler2D1_Float3,
     BuiltInName::texture2DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0H2B0B1C,
+    BuiltInParameters::p0H2B1B1B1C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -6847,7 +6847,7 @@ constexpr const TFunction kFunction_texture2DProj_0H3B(
     BuiltInId::texture2DProj_Sampler2D1_Float4,
     BuiltInName::texture2DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0H3B0B1C,
+    BuiltInParameters::p0H3B1B1B1C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7018,7 +7018,7 @@ constexpr const TFunction kFunction_dFdxExt_0B(
     BuiltInId::dFdxExt_Float1,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdx,
@@ -7027,7 +7027,7 @@ constexpr const TFunction kFunction_dFdxExt_1B(
     BuiltInId::dFdxExt_Float2,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdx,
@@ -7036,7 +7036,7 @@ constexpr const TFunction kFunction_dFdxExt_2B(
     BuiltInId::dFdxExt_Float3,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdx,
@@ -7045,7 +7045,7 @@ constexpr const TFunction kFunction_dFdxExt_3B(
     BuiltInId::dFdxExt_Float4,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdx,
@@ -7054,7 +7054,7 @@ constexpr const TFunction kFunction_dFdyExt_0B(
     BuiltInId::dFdyExt_Float1,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdy,
@@ -7063,7 +7063,7 @@ constexpr const TFunction kFunction_dFdyExt_1B(
     BuiltInId::dFdyExt_Float2,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdy,
@@ -7072,7 +7072,7 @@ constexpr const TFunction kFunction_dFdyExt_2B(
     BuiltInId::dFdyExt_Float3,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdy,
@@ -7081,7 +7081,7 @@ constexpr const TFunction kFunction_dFdyExt_3B(
     BuiltInId::dFdyExt_Float4,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdy,
@@ -7090,7 +7090,7 @@ constexpr const TFunction kFunction_fwidthExt_0B(
     BuiltInId::fwidthExt_Float1,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFwidth,
@@ -7099,7 +7099,7 @@ constexpr const TFunction kFunction_fwidthExt_1B(
     BuiltInId::fwidthExt_Float2,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFwidth,
@@ -7108,7 +7108,7 @@ constexpr const TFunction kFunction_fwidthExt_2B(
     BuiltInId::fwidthExt_Float3,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFwidth,
@@ -7117,7 +7117,7 @@ constexpr const TFunction kFunction_fwidthExt_3B(
     BuiltInId::fwidthExt_Float4,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFwidth,
@@ -7207,7 +7207,7 @@ constexpr const TFunction kFunction_texture_0P1B(
     BuiltInId::texture_ISampler2D1_Float2,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0P1B0C,
+    BuiltInParameters::p0P1B1B1B1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7216,7 +7216,7 @@ constexpr const TFunction kFunction_texture_0U1B(
     BuiltInId::texture_USampler2D1_Float2,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0U1B0B1C,
+    BuiltInParameters::p0U1B1B1B1C,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7225,7 +7225,7 @@ constexpr const TFunction kFunction_texture_0I2B(
     BuiltInId::texture_Sampler3D1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0I2B0B2C,
+    BuiltInParameters::p0I2B2B2B2C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7234,7 +7234,7 @@ constexpr const TFunction kFunction_texture_0Q2B(
     BuiltInId::texture_ISampler3D1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0Q2B0B2C,
+    BuiltInParameters::p0Q2B2B2B2C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7270,7 +7270,7 @@ constexpr const TFunction kFunction_texture_0W2B(
     BuiltInId::texture_USamplerCube1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0W2B0B,
+    BuiltInParameters::p0W2B2B2B,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7279,7 +7279,7 @@ constexpr const TFunction kFunction_texture_0K2B(
     BuiltInId::texture_Sampler2DArray1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0K2B0B1C,
+    BuiltInParameters::p0K2B1B1B1C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7288,7 +7288,7 @@ constexpr const TFunction kFunction_texture_0S2B(
     BuiltInId::texture_ISampler2DArray1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0S2B0B1C,
+    BuiltInParameters::p0S2B1B1B1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7297,7 +7297,7 @@ constexpr const TFunction kFunction_texture_0X2B(
     BuiltInId::texture_USampler2DArray1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0X2B1C0C,
+    BuiltInParameters::p0X2B1B1B1C,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7306,7 +7306,7 @@ constexpr const TFunction kFunction_textureProj_0H2B(
     BuiltInId::textureProj_Sampler2D1_Float3,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0H2B0B1C,
+    BuiltInParameters::p0H2B1B1B1C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7315,7 +7315,7 @@ constexpr const TFunction kFunction_textureProj_0P2B(
     BuiltInId::textureProj_ISampler2D1_Float3,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0P2B0B1C,
+    BuiltInParameters::p0P2B1B1B1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7333,7 +7333,7 @@ constexpr const TFunction kFunction_textureProj_0H3B(
     BuiltInId::textureProj_Sampler2D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0H3B0B1C,
+    BuiltInParameters::p0H3B1B1B1C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7342,7 +7342,7 @@ constexpr const TFunction kFunction_textureProj_0P3B(
     BuiltInId::textureProj_ISampler2D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0P3B0B1C,
+    BuiltInParameters::p0P3B1B1B1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7351,7 +7351,7 @@ constexpr const TFunction kFunction_textureProj_0U3B(
     BuiltInId::textureProj_USampler2D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0U3B1C0B,
+    BuiltInParameters::p0U3B1B1B1C,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7360,7 +7360,7 @@ constexpr const TFunction kFunction_textureProj_0I3B(
     BuiltInId::textureProj_Sampler3D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0I3B2C0B,
+    BuiltInParameters::p0I3B2B2B2C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7369,7 +7369,7 @@ constexpr const TFunction kFunction_textureProj_0Q3B(
     BuiltInId::textureProj_ISampler3D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0Q3B0B2C,
+    BuiltInParameters::p0Q3B2B2B2C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -7522,7 +7522,7 @@ constexpr const TFunction kFunction_textureProj_0Z3B(
     BuiltInId::textureProj_Sampler2DShadow1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0Z3B0B1C,
+    BuiltInParameters::p0Z3B1B1B1C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -8116,7 +8116,7 @@ constexpr const TFunction kFunction_textureOffset_0U1B1C(
     BuiltInId::textureOffset_USampler2D1_Float2_Int2,
     BuiltInName::textureOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0U1B1C0C,
+    BuiltInParameters::p0U1B1C0B,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -8179,7 +8179,7 @@ constexpr const TFunction kFunction_textureOffset_0X2B1C(
     BuiltInId::textureOffset_USampler2DArray1_Float3_Int2,
     BuiltInName::textureOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0X2B1C0C,
+    BuiltInParameters::p0X2B1C0B,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9322,7 +9322,7 @@ constexpr const TFunction kFunction_textureGather_0P1B(
     BuiltInId::textureGather_ISampler2D1_Float2,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0P1B0C,
+    BuiltInParameters::p0P1B1B1B1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9331,7 +9331,7 @@ constexpr const TFunction kFunction_textureGather_0U1B(
     BuiltInId::textureGather_USampler2D1_Float2,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0U1B0B1C,
+    BuiltInParameters::p0U1B1B1B1C,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9367,7 +9367,7 @@ constexpr const TFunction kFunction_textureGather_0K2B(
     BuiltInId::textureGather_Sampler2DArray1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0K2B0B1C,
+    BuiltInParameters::p0K2B1B1B1C,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9376,7 +9376,7 @@ constexpr const TFunction kFunction_textureGather_0S2B(
     BuiltInId::textureGather_ISampler2DArray1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0S2B0B1C,
+    BuiltInParameters::p0S2B1B1B1C,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9385,7 +9385,7 @@ constexpr const TFunction kFunction_textureGather_0X2B(
     BuiltInId::textureGather_USampler2DArray1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0X2B1C0C,
+    BuiltInParameters::p0X2B1B1B1C,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9439,7 +9439,7 @@ constexpr const TFunction kFunction_textureGather_0W2B(
     BuiltInId::textureGather_USamplerCube1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0W2B0B,
+    BuiltInParameters::p0W2B2B2B,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9547,7 +9547,7 @@ constexpr const TFunction kFunction_textureGatherOffset_0U1B1C(
     BuiltInId::textureGatherOffset_USampler2D1_Float2_Int2,
     BuiltInName::textureGatherOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0U1B1C0C,
+    BuiltInParameters::p0U1B1C0B,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9601,7 +9601,7 @@ constexpr const TFunction kFunction_textureGatherOffset_0X2B1C(
     BuiltInId::textureGatherOffset_USampler2DArray1_Float3_Int2,
     BuiltInName::textureGatherOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0X2B1C0C,
+    BuiltInParameters::p0X2B1C0B,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -9655,7 +9655,7 @@ constexpr const TFunction kFunction_dFdx_0B(
     BuiltInId::dFdx_Float1,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdx,
@@ -9664,7 +9664,7 @@ constexpr const TFunction kFunction_dFdx_1B(
     BuiltInId::dFdx_Float2,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdx,
@@ -9673,7 +9673,7 @@ constexpr const TFunction kFunction_dFdx_2B(
     BuiltInId::dFdx_Float3,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdx,
@@ -9682,7 +9682,7 @@ constexpr const TFunction kFunction_dFdx_3B(
     BuiltInId::dFdx_Float4,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdx,
@@ -9691,7 +9691,7 @@ constexpr const TFunction kFunction_dFdy_0B(
     BuiltInId::dFdy_Float1,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdy,
@@ -9700,7 +9700,7 @@ constexpr const TFunction kFunction_dFdy_1B(
     BuiltInId::dFdy_Float2,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdy,
@@ -9709,7 +9709,7 @@ constexpr const TFunction kFunction_dFdy_2B(
     BuiltInId::dFdy_Float3,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdy,
@@ -9718,7 +9718,7 @@ constexpr const TFunction kFunction_dFdy_3B(
     BuiltInId::dFdy_Float4,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdy,
@@ -9727,7 +9727,7 @@ constexpr const TFunction kFunction_fwidth_0B(
     BuiltInId::fwidth_Float1,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p0B0C,
+    BuiltInParameters::p0B_o_0B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFwidth,
@@ -9736,7 +9736,7 @@ constexpr const TFunction kFunction_fwidth_1B(
     BuiltInId::fwidth_Float2,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p1B1B0B,
+    BuiltInParameters::p1B_o_1B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFwidth,
@@ -9745,7 +9745,7 @@ constexpr const TFunction kFunction_fwidth_2B(
     BuiltInId::fwidth_Float3,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p2B2C,
+    BuiltInParameters::p2B_o_2B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFwidth,
@@ -9754,7 +9754,7 @@ constexpr const TFunction kFunction_fwidth_3B(
     BuiltInId::fwidth_Float4,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p3B1B,
+    BuiltInParameters::p3B_o_3B,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFwidth,
@@ -10038,114 +10038,6 @@ constexpr const TFunction kFunction_imageSize_0n(
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
     false);
-constexpr const TFunction kFunction_imageLoad_0c1C(
-    BuiltInId::imageLoad_Image2D1_Int2,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0c1C3B,
-    2,
-    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0d1C(
-    BuiltInId::imageLoad_IImage2D1_Int2,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0d1C3C,
-    2,
-    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0e1C(
-    BuiltInId::imageLoad_UImage2D1_Int2,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0e1C3D,
-    2,
-    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0f2C(
-    BuiltInId::imageLoad_Image3D1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0f2C3B,
-    2,
-    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0g2C(
-    BuiltInId::imageLoad_IImage3D1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0g2C3C,
-    2,
-    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0h2C(
-    BuiltInId::imageLoad_UImage3D1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0h2C3D,
-    2,
-    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0i2C(
-    BuiltInId::imageLoad_Image2DArray1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0i2C3B,
-    2,
-    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0j2C(
-    BuiltInId::imageLoad_IImage2DArray1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0j2C3C,
-    2,
-    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0k2C(
-    BuiltInId::imageLoad_UImage2DArray1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0k2C3D,
-    2,
-    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0l2C(
-    BuiltInId::imageLoad_ImageCube1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0l2C3B,
-    2,
-    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0m2C(
-    BuiltInId::imageLoad_IImageCube1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0m2C3C,
-    2,
-    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
-constexpr const TFunction kFunction_imageLoad_0n2C(
-    BuiltInId::imageLoad_UImageCube1_Int3,
-    BuiltInName::imageLoad,
-    TExtension::UNDEFINED,
-    BuiltInParameters::p0n2C3D,
-    2,
-    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
-    EOpCallBuiltInFunction,
-    false);
 constexpr const TFunction kFunction_imageStore_0c1C3B(
     BuiltInId::imageStore_Image2D1_Int2_Float4,
     BuiltInName::imageStore,
@@ -10254,6 +10146,114 @@ constexpr const TFunction kFunction_imageStore_0n2C3D(
     StaticType::Get<EbtVoid, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
     false);
+constexpr const TFunction kFunction_imageLoad_0c1C(
+    BuiltInId::imageLoad_Image2D1_Int2,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0c1C3B,
+    2,
+    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0d1C(
+    BuiltInId::imageLoad_IImage2D1_Int2,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0d1C3C,
+    2,
+    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0e1C(
+    BuiltInId::imageLoad_UImage2D1_Int2,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0e1C3D,
+    2,
+    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0f2C(
+    BuiltInId::imageLoad_Image3D1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0f2C3B,
+    2,
+    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0g2C(
+    BuiltInId::imageLoad_IImage3D1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0g2C3C,
+    2,
+    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0h2C(
+    BuiltInId::imageLoad_UImage3D1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0h2C3D,
+    2,
+    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0i2C(
+    BuiltInId::imageLoad_Image2DArray1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0i2C3B,
+    2,
+    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0j2C(
+    BuiltInId::imageLoad_IImage2DArray1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0j2C3C,
+    2,
+    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0k2C(
+    BuiltInId::imageLoad_UImage2DArray1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0k2C3D,
+    2,
+    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0l2C(
+    BuiltInId::imageLoad_ImageCube1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0l2C3B,
+    2,
+    StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0m2C(
+    BuiltInId::imageLoad_IImageCube1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0m2C3C,
+    2,
+    StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
+constexpr const TFunction kFunction_imageLoad_0n2C(
+    BuiltInId::imageLoad_UImageCube1_Int3,
+    BuiltInName::imageLoad,
+    TExtension::UNDEFINED,
+    BuiltInParameters::p0n2C3D,
+    2,
+    StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
+    EOpCallBuiltInFunction,
+    false);
 constexpr const TFunction kFunction_memoryBarrier_(
     BuiltInId::memoryBarrier,
     BuiltInName::memoryBarrier,
@@ -6,7 +6,7 @@
 # gen_builtin_symbols.py:
 #  Code generation for the built-in symbol tables.
 
-from collections import OrderedDict
+from collections import namedtuple, OrderedDict
 from datetime import date
 import argparse
 import hashlib
@@ -24,29 +24,68 @@ set_working_dir()
 variables_json_filename = 'builtin_variables.json'
 functions_txt_filename = 'builtin_function_declarations.txt'
 hash_filename = 'builtin_symbols_hash_autogen.txt'
+output_hash_filename = 'builtin_symbols_output_hash_autogen.txt'
+
+immutablestring_test_filename = '../../tests/compiler_tests/ImmutableString_test_autogen.cpp'
+builtin_header_filename = 'tree_util/BuiltIn_autogen.h'
+symboltable_cpp_filename = 'SymbolTable_autogen.cpp'
+parsecontext_header_filename = 'ParseContext_autogen.h'
+symboltable_h_filename = 'SymbolTable_autogen.h'
 
 all_inputs = [os.path.abspath(__file__), variables_json_filename, functions_txt_filename]
+all_outputs = [immutablestring_test_filename, builtin_header_filename, symboltable_cpp_filename,
+               parsecontext_header_filename, symboltable_h_filename]
 # This script takes a while to run since it searches for hash collisions of mangled names. To avoid
-# running it unnecessarily, we first check if we've already ran it with the same inputs.
+# running it unnecessarily, we first check if we've already ran it with the same inputs. The outputs
+# still need to be generated if any of them is missing.
 m = hashlib.md5()
 for input_path in all_inputs:
-    with open(input_path, 'rU') as input_file:
-        m.update(input_file.read())
+    with open(input_path, 'rb') as input_file:
+        m.update(input_file.read().replace(b'\r\n', b'\n'))
 input_hash = m.hexdigest()
-if os.path.exists(hash_filename):
+if os.path.exists(hash_filename) and all(os.path.exists(output_path) for output_path in all_outputs):
     with open(hash_filename) as hash_file:
-        if input_hash == hash_file.read():
-            print "Canceling ESSL static builtins code generator - generated hash matches inputs."
-            sys.exit(0)
+        input_hash_matches = input_hash == hash_file.read()
+    if input_hash_matches:
+        print("Canceling ESSL static builtins code generator - generated hash matches inputs.")
+        # Refresh the hash files' timestamps so run_code_generation.py doesn't consider them stale.
+        for stamp_path in [hash_filename, output_hash_filename]:
+            if os.path.exists(stamp_path):
+                os.utime(stamp_path, None)
+        sys.exit(0)
 
 parser = argparse.ArgumentParser()
 parser.add_argument('--dump-intermediate-json', help='Dump parsed function data as a JSON file builtin_functions.json', action="store_true")
 args = parser.parse_args()
 
-template_immutablestringtest_cpp = """// GENERATED FILE - DO NOT EDIT.
-// Generated by {script_name} using data from {function_data_source_name}.
+# The largest outputs are streamed to their files section by section instead of being substituted
+# into the template as a whole. These templates are split into alternating literal text and
+# ${placeholder} names once here.
+template_placeholder_re = re.compile(r'\$\{(\w+)\}')
+
+def write_template(write, template_parts, strings, line_lists):
+    # Literal text and short substituted values are gathered and written together, so that e.g. the
+    # whole copyright header reaches write() in one piece.
+    text = []
+    for index, part in enumerate(template_parts):
+        if index % 2 == 0:
+            text.append(part)
+        elif part in line_lists:
+            write(''.join(text))
+            text = []
+            # Lists of lines are written one by one rather than joined into one big string first.
+            for line_index, line in enumerate(line_lists[part]):
+                if line_index > 0:
+                    write('\n')
+                write(line)
+        else:
+            text.append(str(strings[part]))
+    write(''.join(text))
+
+template_immutablestringtest_cpp = template_placeholder_re.split("""// GENERATED FILE - DO NOT EDIT.
+// Generated by ${script_name} using data from ${function_data_source_name}.
 //
-// Copyright {copyright_year} The ANGLE Project Authors. All rights reserved.
+// Copyright ${copyright_year} The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -57,15 +96,15 @@ template_immutablestringtest_cpp = """// GENERATED FILE - DO NOT EDIT.
 #include "gtest/gtest.h"
 
 namespace sh
-{{
+{
 
 TEST(ImmutableStringTest, ScriptGeneratedHashesMatch)
-{{
-{script_generated_hash_tests}
-}}
+{
+${script_generated_hash_tests}
+}
 
-}}  // namespace sh
-"""
+}  // namespace sh
+""")
 
 # The header file has a "get" function for each variable. They are used in traversers.
 # It also declares id values of built-ins with human readable names, so they can be used to identify built-ins.
@@ -140,11 +179,11 @@ class TSymbolTableBase
 """
 
 # By having the variables defined in a cpp file we ensure that there's just one instance of each of the declared variables.
-template_symboltable_cpp = """// GENERATED FILE - DO NOT EDIT.
-// Generated by {script_name} using data from {variable_data_source_name} and
-// {function_data_source_name}.
+template_symboltable_cpp = template_placeholder_re.split("""// GENERATED FILE - DO NOT EDIT.
+// Generated by ${script_name} using data from ${variable_data_source_name} and
+// ${function_data_source_name}.
 //
-// Copyright {copyright_year} The ANGLE Project Authors. All rights reserved.
+// Copyright ${copyright_year} The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -161,94 +200,94 @@ template_symboltable_cpp = """// GENERATED FILE - DO NOT EDIT.
 #include "compiler/translator/SymbolTable.h"
 
 namespace sh
-{{
+{
 
 // Since some of the BuiltInId declarations are used outside of constexpr expressions, we need to
 // have these definitions without an initializer. C++17 should eventually remove the need for this.
-{builtin_id_definitions}
+${builtin_id_definitions}
 
-const int TSymbolTable::kLastBuiltInId = {last_builtin_id};
+const int TSymbolTable::kLastBuiltInId = ${last_builtin_id};
 
 namespace BuiltInName
-{{
+{
 
 constexpr const ImmutableString _empty("");
-{name_declarations}
+${name_declarations}
 
-}}  // namespace BuiltInName
+}  // namespace BuiltInName
 
 // TODO(oetuaho): Would be nice to make this a class instead of a namespace so that we could friend
 // this from TVariable. Now symbol constructors taking an id have to be public even though they're
 // not supposed to be accessible from outside of here. http://anglebug.com/2390
 namespace BuiltInVariable
-{{
+{
 
-{variable_declarations}
+${variable_declarations}
 
-{get_variable_definitions}
+${get_variable_definitions}
 
-}};  // namespace BuiltInVariable
+};  // namespace BuiltInVariable
 
 namespace BuiltInParameters
-{{
+{
 
-{parameter_declarations}
+${parameter_declarations}
 
-}}  // namespace BuiltInParameters
+}  // namespace BuiltInParameters
 
 namespace UnmangledBuiltIns
-{{
+{
 
-{unmangled_builtin_declarations}
+${unmangled_builtin_declarations}
 
-}}  // namespace UnmangledBuiltIns
+}  // namespace UnmangledBuiltIns
 
 // TODO(oetuaho): Would be nice to make this a class instead of a namespace so that we could friend
 // this from TFunction. Now symbol constructors taking an id have to be public even though they're
 // not supposed to be accessible from outside of here. http://anglebug.com/2390
 namespace BuiltInFunction
-{{
+{
 
-{function_declarations}
+${function_declarations}
 
-}}  // namespace BuiltInFunction
+}  // namespace BuiltInFunction
 
 void TSymbolTable::initializeBuiltInVariables(sh::GLenum shaderType,
                                               ShShaderSpec spec,
                                               const ShBuiltInResources &resources)
-{{
-    const TSourceLoc zeroSourceLoc = {{0, 0, 0, 0}};
-{init_member_variables}
-}}
+{
+    const TSourceLoc zeroSourceLoc = {0, 0, 0, 0};
+${init_member_variables}
+}
 
 const TSymbol *TSymbolTable::findBuiltIn(const ImmutableString &name,
                                          int shaderVersion) const
-{{
-    if (name.length() > {max_mangled_name_length})
-    {{
+{
+    if (name.length() > ${max_mangled_name_length})
+    {
         return nullptr;
-    }}
+    }
     uint32_t nameHash = name.mangledNameHash();
     if ((nameHash >> 31) != 0)
-    {{
-        // The name contains [ or {{.
+    {
+        // The name contains [ or {.
         return nullptr;
-    }}
-{get_builtin}
-}}
+    }
+${get_builtin}
+}
 
 const UnmangledBuiltIn *TSymbolTable::getUnmangledBuiltInForShaderVersion(const ImmutableString &name, int shaderVersion)
-{{
-    if (name.length() > {max_unmangled_name_length})
-    {{
+{
+    if (name.length() > ${max_unmangled_name_length})
+    {
         return nullptr;
-    }}
+    }
     uint32_t nameHash = name.mangledNameHash();
-{get_unmangled_builtin}
-}}
+${get_unmangled_builtin}
+}
 
-}}  // namespace sh
-"""
+}  // namespace sh
+""")
 
 template_parsecontext_header = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {variable_data_source_name} and
@@ -378,50 +417,83 @@ class GroupedList:
     def get_max_name_length(self):
         return self.max_name_length
 
+    def get_name_hashes(self):
+        # The same name is often present on several levels and conditions, so each unique name is
+        # hashed just once.
+        name_hashes = {}
+        for level in levels:
+            for objs in self.objs[level].values():
+                for name in objs:
+                    if name not in name_hashes:
+                        name_hashes[name] = mangledNameHash(name)
+        return name_hashes
+
     def get_switch_code(self):
+        name_hashes = self.get_name_hashes()
         code = []
+        write = code.append
         for level in levels:
             if len(self.objs[level]) == 0:
                 continue
             level_condition = get_shader_version_condition_for_level(level)
             if level_condition != '':
-                code.append('if ({condition})\n {{'.format(condition = level_condition))
+                write('if (%s)\n {' % level_condition)
 
-            for condition, objs in self.objs[level].iteritems():
+            for condition, objs in self.objs[level].items():
                 if len(objs) > 0:
                     if condition != 'NO_CONDITION':
-                        condition_header = '  if ({condition})\n {{'.format(condition = condition)
-                        code.append(condition_header.replace('shaderType', 'mShaderType'))
+                        write('  if (%s)\n {' % condition.replace('shaderType', 'mShaderType'))
 
                     switch = {}
-                    for name, obj in objs.iteritems():
-                        name_hash = mangledNameHash(name)
+                    for name, obj in objs.items():
+                        name_hash = name_hashes[name]
                         if name_hash not in switch:
                             switch[name_hash] = []
                         switch[name_hash].append(obj['hash_matched_code'])
 
-                    code.append('switch(nameHash) {')
-                    for name_hash, obj in sorted(switch.iteritems()):
-                        code.append('case 0x' + ('%08x' % name_hash) + 'u:\n{')
-                        code += obj
-                        code.append('break;\n}')
-                    code.append('}')
+                    write('switch(nameHash) {')
+                    for name_hash, obj in sorted(switch.items()):
+                        write('case 0x%08xu:\n{' % name_hash)
+                        code.extend(obj)
+                        write('break;\n}')
+                    write('}')
 
                     if condition != 'NO_CONDITION':
-                        code.append('}')
+                        write('}')
 
             if level_condition != '':
-                code.append('}')
-        code.append('return nullptr;')
-        return '\n'.join(code)
+                write('}')
+        write('return nullptr;')
+        return code
+
+basic_type_map = {
+    'float': 'Float',
+    'int': 'Int',
+    'uint': 'UInt',
+    'bool': 'Bool',
+    'void': 'Void',
+    'atomic_uint': 'AtomicCounter',
+    'yuvCscStandardEXT': 'YuvCscStandardEXT'
+}
+
+basic_type_prefix_map = {'': 'Float', 'i': 'Int', 'u': 'UInt', 'b': 'Bool', 'v': 'Void'}
+
+# Type parsing is done for every parameter of every function, so the regexes are compiled only once.
+vec_re = re.compile(r'^([iub]?)vec([234]?)$')
+mat_re = re.compile(r'^mat([234])(x([234]))?$')
+gen_re = re.compile(r'^gen([IUB]?)Type$')
 
 class TType:
     def __init__(self, glsl_header_type):
-        if isinstance(glsl_header_type, basestring):
-            self.data = self.parse_type(glsl_header_type)
-        else:
+        if isinstance(glsl_header_type, dict):
             self.data = glsl_header_type
+        else:
+            self.data = self.parse_type(glsl_header_type)
         self.normalize()
+        # These are computed on first use and then reused, since the same types appear in many
+        # function declarations.
+        self.statictype_string = None
+        self.mangled_name = None
 
     def normalize(self):
         # Note that this will set primarySize and secondarySize also on genTypes. In that case they
@@ -438,14 +510,19 @@ class TType:
             self.data['qualifier'] = 'Global'
 
     def get_statictype_string(self):
-        template_type = 'StaticType::Get<Ebt{basic}, Ebp{precision}, Evq{qualifier}, {primarySize}, {secondarySize}>()'
-        return template_type.format(**self.data)
+        if self.statictype_string is None:
+            template_type = 'StaticType::Get<Ebt{basic}, Ebp{precision}, Evq{qualifier}, {primarySize}, {secondarySize}>()'
+            self.statictype_string = template_type.format(**self.data)
+        return self.statictype_string
 
     def get_dynamic_type_string(self):
         template_type = 'new TType(Ebt{basic}, Ebp{precision}, Evq{qualifier}, {primarySize}, {secondarySize})'
         return template_type.format(**self.data)
 
     def get_mangled_name(self):
+        if self.mangled_name is not None:
+            return self.mangled_name
+
         mangled_name = ''
 
         size_key = (self.data['secondarySize'] - 1) * 4 + self.data['primarySize'] - 1
@@ -455,6 +532,7 @@ class TType:
             mangled_name += chr(ord('A') + size_key - 10)
 
         mangled_name += get_basic_mangled_name(self.data['basic'])
+        self.mangled_name = mangled_name
         return mangled_name
 
     def get_human_readable_name(self):
@@ -507,24 +585,11 @@ class TType:
             type_obj['qualifier'] = 'InOut'
             return type_obj
 
-        basic_type_map = {
-            'float': 'Float',
-            'int': 'Int',
-            'uint': 'UInt',
-            'bool': 'Bool',
-            'void': 'Void',
-            'atomic_uint': 'AtomicCounter',
-            'yuvCscStandardEXT': 'YuvCscStandardEXT'
-        }
-
         if glsl_header_type in basic_type_map:
             return {'basic': basic_type_map[glsl_header_type]}
 
         type_obj = {}
 
-        basic_type_prefix_map = {'': 'Float', 'i': 'Int', 'u': 'UInt', 'b': 'Bool', 'v': 'Void'}
-
-        vec_re = re.compile(r'^([iub]?)vec([234]?)$')
         vec_match = vec_re.match(glsl_header_type)
         if vec_match:
             type_obj['basic'] = basic_type_prefix_map[vec_match.group(1)]
@@ -536,7 +601,6 @@ class TType:
                 type_obj['primarySize'] = int(vec_match.group(2))
             return type_obj
 
-        mat_re = re.compile(r'^mat([234])(x([234]))?$')
         mat_match = mat_re.match(glsl_header_type)
         if mat_match:
             type_obj['basic'] = 'Float'
@@ -549,7 +613,6 @@ class TType:
                 type_obj['secondarySize'] = int(mat_match.group(3))
             return type_obj
 
-        gen_re = re.compile(r'^gen([IUB]?)Type$')
         gen_match = gen_re.match(glsl_header_type)
         if gen_match:
             type_obj['basic'] = basic_type_prefix_map[gen_match.group(1).lower()]
@@ -572,6 +635,18 @@ class TType:
 
         raise Exception('Unrecognized type: ' + str(glsl_header_type))
 
+# TType objects are not modified after they have been constructed, so all the types parsed from the
+# same GLSL type string can share a single object.
+parsed_types = {}
+def get_parsed_type(glsl_header_type):
+    if glsl_header_type not in parsed_types:
+        parsed_types[glsl_header_type] = TType(glsl_header_type)
+    return parsed_types[glsl_header_type]
+
+# Matches any line of the function declarations file, so that each line only needs to be matched
+# once to find out what kind of line it is.
+declarations_line_re = re.compile(r'^(?:GROUP BEGIN (?P<group_begin>.*)|GROUP END (?P<group_end>.*)|DEFAULT METADATA(?P<default_metadata>.*)|(?P<return_type>\w+) (?P<name>\w+)\((?P<parameters>.*)\);)$')
+
 def get_parsed_functions():
 
     def parse_function_parameters(parameters):
@@ -580,36 +655,45 @@ def get_parsed_functions():
         parametersOut = []
         parameters = parameters.split(', ')
         for parameter in parameters:
-            parametersOut.append(TType(parameter.strip()))
+            parametersOut.append(get_parsed_type(parameter.strip()))
         return parametersOut
 
-    lines = []
-    with open(functions_txt_filename) as f:
-        lines = f.readlines()
-    lines = [line.strip() for line in lines if line.strip() != '' and not line.strip().startswith('//')]
+    # Many groups share identical metadata, so each distinct JSON string is only parsed once. The
+    # parsed metadata is only ever copied from, so sharing it is safe.
+    parsed_metadata = {}
+    def parse_metadata(metadata_json):
+        if metadata_json not in parsed_metadata:
+            parsed_metadata[metadata_json] = json.loads(metadata_json)
+        return parsed_metadata[metadata_json]
 
-    fun_re = re.compile(r'^(\w+) (\w+)\((.*)\);$')
+    with open(functions_txt_filename) as f:
+        lines = f.read().split('\n')
 
     parsed_functions = OrderedDict()
     group_stack = []
     default_metadata = {}
 
     for line in lines:
-        fun_match = fun_re.match(line)
-        if line.startswith('GROUP BEGIN '):
-            group_rest = line[12:].strip()
+        line = line.strip()
+        if line == '' or line.startswith('//'):
+            continue
+        line_match = declarations_line_re.match(line)
+        if line_match is None:
+            raise Exception('Unexpected function input line: ' + line)
+        if line_match.group('group_begin') is not None:
+            group_rest = line_match.group('group_begin').strip()
             group_parts = group_rest.split(' ', 1)
             current_group = {
                 'functions': [],
                 'name': group_parts[0],
-                'subgroups': {}
+                'subgroups': OrderedDict()
             }
             if len(group_parts) > 1:
-                group_metadata = json.loads(group_parts[1])
+                group_metadata = parse_metadata(group_parts[1])
                 current_group.update(group_metadata)
             group_stack.append(current_group)
-        elif line.startswith('GROUP END '):
-            group_end_name = line[10:].strip()
+        elif line_match.group('group_end') is not None:
+            group_end_name = line_match.group('group_end').strip()
             current_group = group_stack[-1]
             if current_group['name'] != group_end_name:
                 raise Exception('GROUP END: Unexpected function group name "' + group_end_name + '" was expecting "' + current_group['name'] + '"')
@@ -621,22 +705,20 @@ def get_parsed_functions():
             else:
                 super_group = group_stack[-1]
                 super_group['subgroups'][current_group['name']] = current_group
-        elif line.startswith('DEFAULT METADATA'):
-            line_rest = line[16:].strip()
-            default_metadata = json.loads(line_rest)
-        elif fun_match:
-            return_type = fun_match.group(1)
-            name = fun_match.group(2)
-            parameters = fun_match.group(3)
+        elif line_match.group('default_metadata') is not None:
+            line_rest = line_match.group('default_metadata').strip()
+            default_metadata = parse_metadata(line_rest)
+        else:
+            return_type = line_match.group('return_type')
+            name = line_match.group('name')
+            parameters = line_match.group('parameters')
             function_props = {
                 'name': name,
-                'returnType': TType(return_type),
+                'returnType': get_parsed_type(return_type),
                 'parameters': parse_function_parameters(parameters)
             }
             function_props.update(default_metadata)
             group_stack[-1]['functions'].append(function_props)
-        else:
-            raise Exception('Unexpected function input line: ' + line)
 
     return parsed_functions
 
@@ -648,7 +730,7 @@ if args.dump_intermediate_json:
             if isinstance(obj, TType):
                 return obj.data
             else:
-                raise "Cannot serialize to JSON: " + str(obj)
+                raise Exception('Cannot serialize to JSON: ' + str(obj))
         json.dump(parsed_functions, outfile, indent=4, separators=(',', ': '), default=serialize_obj)
 
 with open(variables_json_filename) as f:
@@ -660,8 +742,8 @@ builtin_id_declarations = []
 # Definitions of symbol unique ids needed for those ids used outside of constexpr expressions.
 builtin_id_definitions = []
 
-# Declarations of name string variables
-name_declarations = set()
+# Declarations of name string variables. Map from C++ variable name to the full declaration.
+name_declarations = {}
 
 # Declarations of builtin TVariables
 variable_declarations = []
@@ -684,14 +766,17 @@ init_member_variables = []
 # Code for querying builtins.
 get_builtin_if_statements = GroupedList()
 
-# Declarations of UnmangledBuiltIn objects
-unmangled_builtin_declarations = set()
+# Declarations of UnmangledBuiltIn objects. Map from extension name to the full declaration.
+unmangled_builtin_declarations = {}
 
 # Code for querying builtin function unmangled names.
 unmangled_function_if_statements = GroupedList()
 
-# Code for testing that script-generated hashes match with runtime computed hashes.
-script_generated_hash_tests = OrderedDict()
+# Names and hashes for testing that script-generated hashes match with runtime computed hashes, in
+# the order they were first hashed. The same name may be hashed many times, so the names that
+# already have a test are tracked separately.
+script_generated_hashes = []
+script_generated_hash_test_names = set()
 
 # Functions for testing whether a builtin belongs in group.
 is_in_group_definitions = []
@@ -702,12 +787,18 @@ variable_name_count = {}
 id_counter = 0
 
 fnvPrime = 16777619
-def hash32(str):
-    fnvOffsetBasis = 0x811c9dc5
-    hash = fnvOffsetBasis
-    for c in str:
-        hash = hash ^ ord(c)
-        hash = (hash * fnvPrime) & 0xffffffff
+hash32_cache = {}
+# The prime and mask are bound as default arguments so that they are fast local lookups.
+def hash32(str, prime = fnvPrime, mask = 0xffffffff):
+    # The same names and function name prefixes get hashed repeatedly, so the results are cached.
+    if str in hash32_cache:
+        return hash32_cache[str]
+    # FNV-1a over the ASCII bytes of the string. Iterating a bytearray yields ints directly, which
+    # saves an ord() call per character.
+    hash = 0x811c9dc5
+    for c in bytearray(str, 'ascii'):
+        hash = ((hash ^ c) * prime) & mask
+    hash32_cache[str] = hash
     return hash
 
 def mangledNameHash(str, save_test = True):
@@ -723,11 +814,17 @@ def mangledNameHash(str, save_test = True):
             has_array_or_block_param_bit = 1
         index += 1
     hash = ((hash >> 13) ^ (hash & 0x1fff)) | (index << 19) | (paren_location << 25) | (has_array_or_block_param_bit << 31)
-    if save_test:
-        sanity_check = '    ASSERT_EQ(0x{hash}u, ImmutableString("{str}").mangledNameHash());'.format(hash = ('%08x' % hash), str = str)
-        script_generated_hash_tests.update({sanity_check: None})
+    if save_test and str not in script_generated_hash_test_names:
+        script_generated_hash_test_names.add(str)
+        script_generated_hashes.append((str, hash))
     return hash
 
+def get_script_generated_hash_tests():
+    tests = []
+    for name, hash in script_generated_hashes:
+        tests.append('    ASSERT_EQ(0x%08xu, ImmutableString("%s").mangledNameHash());' % (hash, name))
+    return tests
+
 def get_suffix(props):
     if 'suffix' in props:
         return props['suffix']
@@ -762,16 +859,14 @@ def get_parameters(function_props):
     return []
 
 def get_function_mangled_name(function_name, parameters):
-    mangled_name = function_name + '('
-    for param in parameters:
-        mangled_name += param.get_mangled_name()
-    return mangled_name
+    return function_name + '(' + ''.join([param.get_mangled_name() for param in parameters])
 
 def get_function_human_readable_name(function_name, parameters):
-    name = function_name
+    name_parts = [function_name]
     for param in parameters:
-        name += '_' + param.get_human_readable_name()
-    return name
+        name_parts.append('_')
+        name_parts.append(param.get_human_readable_name())
+    return ''.join(name_parts)
 
 ttype_mangled_name_variants = []
 for basic_type in basic_types_enumeration:
@@ -790,8 +885,8 @@ def gen_parameters_variant_ids(str_len):
     # Note that this doesn't generate variants with array parameters or struct / interface block parameters. They are assumed to have been filtered out separately.
     if str_len % 2 != 0:
         raise Exception('Expecting parameters mangled name length to be divisible by two')
-    num_variants = pow(len(ttype_mangled_name_variants), str_len / 2)
-    return xrange(num_variants)
+    num_variants = pow(len(ttype_mangled_name_variants), str_len // 2)
+    return range(num_variants)
 
 def get_parameters_mangled_name_variant(variant_id, paren_location, total_length):
     str_len = total_length - paren_location - 1
@@ -799,10 +894,10 @@ def get_parameters_mangled_name_variant(variant_id, paren_location, total_length
         raise Exception('Expecting parameters mangled name length to be divisible by two')
     variant = ''
     while (len(variant)) < str_len:
-        parameter_index = len(variant) / 2
+        parameter_index = len(variant) // 2
         parameter_variant_index = variant_id
-        for i in xrange(parameter_index):
-            parameter_variant_index = parameter_variant_index / len(ttype_mangled_name_variants)
+        for i in range(parameter_index):
+            parameter_variant_index = parameter_variant_index // len(ttype_mangled_name_variants)
         parameter_variant_index = parameter_variant_index % len(ttype_mangled_name_variants)
         variant += ttype_mangled_name_variants[parameter_variant_index]
     return variant
@@ -811,31 +906,31 @@ def get_parameters_mangled_name_variant(variant_id, paren_location, total_length
 # plus a variant of the parameters. This is faster than constructing the whole string and then
 # calculating the hash for that.
 num_type_variants = len(ttype_mangled_name_variants)
-def get_mangled_name_variant_hash(prefix_hash32, variant_id, paren_location, total_length):
+# This is called for every candidate parameter list when searching for hash collisions, so the
+# character codes of each type's mangled name are looked up ahead of time.
+ttype_mangled_name_variant_chars = [(ord(variant[0]), ord(variant[1])) for variant in ttype_mangled_name_variants]
+def get_mangled_name_variant_hash(prefix_hash32, variant_id, paren_location, total_length, prime = fnvPrime, mask = 0xffffffff, variant_chars = ttype_mangled_name_variant_chars):
     hash = prefix_hash32
     parameter_count = (total_length - paren_location) >> 1
     parameter_variant_id_base = variant_id
-    for parameter_index in xrange(parameter_count):
+    for parameter_index in range(parameter_count):
         parameter_variant_index = parameter_variant_id_base % num_type_variants
-        param_str = ttype_mangled_name_variants[parameter_variant_index]
-        hash = hash ^ ord(param_str[0])
-        hash = (hash * fnvPrime) & 0xffffffff
-        hash = hash ^ ord(param_str[1])
-        hash = (hash * fnvPrime) & 0xffffffff
-        parameter_variant_id_base = parameter_variant_id_base / num_type_variants
+        char0, char1 = variant_chars[parameter_variant_index]
+        hash = ((hash ^ char0) * prime) & mask
+        hash = ((hash ^ char1) * prime) & mask
+        parameter_variant_id_base = parameter_variant_id_base // num_type_variants
     return ((hash >> 13) ^ (hash & 0x1fff)) | (total_length << 19) | (paren_location << 25)
 
 # Sanity check for get_mangled_name_variant_hash:
 if get_mangled_name_variant_hash(hash32("atan("), 3, 4, len("atan(0123")) != mangledNameHash("atan(" + get_parameters_mangled_name_variant(3, 4, len("atan(0123"))):
     raise Exception("get_mangled_name_variant_hash sanity check failed")
 
-def mangled_name_hash_can_collide_with_different_parameters(function_variant_props):
+def mangled_name_hash_can_collide_with_different_parameters(function_name, mangled_name):
     # We exhaustively search through all possible lists of parameters and see if any other mangled
     # name has the same hash.
-    mangled_name = function_variant_props['mangled_name']
     mangled_name_len = len(mangled_name)
     hash = mangledNameHash(mangled_name)
-    mangled_name_prefix = function_variant_props['name'] + '('
+    mangled_name_prefix = function_name + '('
     paren_location = len(mangled_name_prefix) - 1
     prefix_hash32 = hash32(mangled_name_prefix)
     parameters_mangled_name_len = len(mangled_name) - len(mangled_name_prefix)
@@ -849,10 +944,7 @@ def mangled_name_hash_can_collide_with_different_parameters(function_variant_pro
     return False
 
 def get_unique_identifier_name(function_name, parameters):
-    unique_name = function_name + '_'
-    for param in parameters:
-        unique_name += param.get_mangled_name()
-    return unique_name
+    return function_name + '_' + ''.join([param.get_mangled_name() for param in parameters])
 
 def get_variable_name_to_store_parameter(param):
     unique_name = 'pt'
@@ -867,24 +959,32 @@ def get_variable_name_to_store_parameter(param):
 def get_variable_name_to_store_parameters(parameters):
     if len(parameters) == 0:
         return 'empty'
-    unique_name = 'p'
+    name_parts = ['p']
     for param in parameters:
         if 'qualifier' in param.data:
             if param.data['qualifier'] == 'Out':
-                unique_name += '_o_'
+                name_parts.append('_o_')
             if param.data['qualifier'] == 'InOut':
-                unique_name += '_io_'
-        unique_name += param.get_mangled_name()
-    return unique_name
+                name_parts.append('_io_')
+        name_parts.append(param.get_mangled_name())
+    return ''.join(name_parts)
+
+def define_constexpr_variable(name_with_suffix, name, extension, type):
+    variable_declarations.append('constexpr const TVariable kVar_%s(BuiltInId::%s, BuiltInName::%s, SymbolType::BuiltIn, TExtension::%s, %s);' % (
+        name_with_suffix, name_with_suffix, name, extension, type))
 
-def define_constexpr_variable(template_args):
-    template_variable_declaration = 'constexpr const TVariable kVar_{name_with_suffix}(BuiltInId::{name_with_suffix}, BuiltInName::{name}, SymbolType::BuiltIn, TExtension::{extension}, {type});'
-    variable_declarations.append(template_variable_declaration.format(**template_args))
+# A specific variant of a builtin function. All the other properties of the variant are the same as
+# in the function props it was generated from.
+FunctionVariant = namedtuple('FunctionVariant', ['parameters', 'return_type'])
 
 def gen_function_variants(function_name, function_props):
-    function_variants = []
     parameters = get_parameters(function_props)
-    function_is_gen_type = False
+    # Most functions don't have generic parameters, so check for that first before validating the
+    # genType values.
+    if not any('genType' in param.data for param in parameters):
+        return [FunctionVariant(parameters, function_props['returnType'])]
+
+    function_variants = []
     gen_type = set()
     for param in parameters:
         if 'genType' in param.data:
@@ -893,22 +993,17 @@ def gen_function_variants(function_name, function_props):
             gen_type.add(param.data['genType'])
             if len(gen_type) > 1:
                 raise Exception('Unexpected multiple values of genType set on the same function: ' + str(list(gen_type)))
-    if len(gen_type) == 0:
-        function_variants.append(function_props)
-        return function_variants
 
     # If we have a gsampler_or_image then we're generating variants for float, int and uint
     # samplers.
     if 'sampler_or_image' in gen_type:
         types = ['', 'I', 'U']
         for type in types:
-            variant_props = function_props.copy()
             variant_parameters = []
             for param in parameters:
                 variant_parameters.append(param.specific_sampler_or_image_type(type))
-            variant_props['parameters'] = variant_parameters
-            variant_props['returnType'] = function_props['returnType'].specific_sampler_or_image_type(type)
-            function_variants.append(variant_props)
+            variant_return_type = function_props['returnType'].specific_sampler_or_image_type(type)
+            function_variants.append(FunctionVariant(variant_parameters, variant_return_type))
         return function_variants
 
     # If we have a normal gentype then we're generating variants for different sizes of vectors.
@@ -916,13 +1011,11 @@ def gen_function_variants(function_name, function_props):
     if 'vec' in gen_type:
         sizes = range(2, 5)
     for size in sizes:
-        variant_props = function_props.copy()
         variant_parameters = []
         for param in parameters:
             variant_parameters.append(param.specific_type(size))
-        variant_props['parameters'] = variant_parameters
-        variant_props['returnType'] = function_props['returnType'].specific_type(size)
-        function_variants.append(variant_props)
+        variant_return_type = function_props['returnType'].specific_type(size)
+        function_variants.append(FunctionVariant(variant_parameters, variant_return_type))
     return function_variants
 
 defined_function_variants = set()
@@ -935,29 +1028,21 @@ def process_single_function_group(condition, group_name, group):
 
     for function_props in group['functions']:
         function_name = function_props['name']
+        name_with_suffix = function_name + get_suffix(function_props)
         level = function_props['level']
         extension = get_extension(function_props)
-        template_args = {
-            'name': function_name,
-            'name_with_suffix': function_name + get_suffix(function_props),
-            'level': level,
-            'extension': extension,
-            'op': get_op(function_name, function_props),
-            'known_to_not_have_side_effects': get_known_to_not_have_side_effects(function_props)
-        }
+        op = get_op(function_name, function_props)
+        known_to_not_have_side_effects = get_known_to_not_have_side_effects(function_props)
 
         function_variants = gen_function_variants(function_name, function_props)
 
-        template_name_declaration = 'constexpr const ImmutableString {name_with_suffix}("{name}");'
-        name_declaration = template_name_declaration.format(**template_args)
-        if not name_declaration in name_declarations:
-            name_declarations.add(name_declaration)
+        if name_with_suffix not in name_declarations:
+            name_declarations[name_with_suffix] = 'constexpr const ImmutableString %s("%s");' % (name_with_suffix, function_name)
 
-        template_unmangled_if = """if (name == BuiltInName::{name_with_suffix})
-{{
-    return &UnmangledBuiltIns::{extension};
-}}"""
-        unmangled_if = template_unmangled_if.format(**template_args)
+        unmangled_if = """if (name == BuiltInName::%s)
+{
+    return &UnmangledBuiltIns::%s;
+}""" % (name_with_suffix, extension)
         unmangled_builtin_no_condition = unmangled_function_if_statements.get(level, 'NO_CONDITION', function_name)
         if unmangled_builtin_no_condition != None and unmangled_builtin_no_condition['extension'] == 'UNDEFINED':
             # We already have this unmangled name without a condition nor extension on the same level. No need to add a duplicate with a condition.
@@ -965,79 +1050,64 @@ def process_single_function_group(condition, group_name, group):
         elif (not unmangled_function_if_statements.has_key(level, condition, function_name)) or extension == 'UNDEFINED':
             # We don't have this unmangled builtin recorded yet or we might replace an unmangled builtin from an extension with one from core.
             unmangled_function_if_statements.add_obj(level, condition, function_name, {'hash_matched_code': unmangled_if, 'extension': extension})
-            unmangled_builtin_declarations.add('constexpr const UnmangledBuiltIn {extension}(TExtension::{extension});'.format(**template_args))
-
-        for function_props in function_variants:
-            template_args['id'] = id_counter
+            if extension not in unmangled_builtin_declarations:
+                unmangled_builtin_declarations[extension] = 'constexpr const UnmangledBuiltIn %s(TExtension::%s);' % (extension, extension)
 
-            parameters = get_parameters(function_props)
+        for function_variant in function_variants:
+            parameters = function_variant.parameters
 
-            template_args['unique_name'] = get_unique_identifier_name(template_args['name_with_suffix'], parameters)
+            unique_name = get_unique_identifier_name(name_with_suffix, parameters)
 
-            if template_args['unique_name'] in defined_function_variants:
+            if unique_name in defined_function_variants:
                 continue
-            defined_function_variants.add(template_args['unique_name'])
-
-            template_args['param_count'] = len(parameters)
-            template_args['return_type'] = function_props['returnType'].get_statictype_string()
-            template_args['mangled_name'] = get_function_mangled_name(function_name, parameters)
-            template_args['human_readable_name'] = get_function_human_readable_name(template_args['name_with_suffix'], parameters)
-            template_args['mangled_name_length'] = len(template_args['mangled_name'])
-
-            template_builtin_id_declaration = '    static constexpr const TSymbolUniqueId {human_readable_name} = TSymbolUniqueId({id});'
-            builtin_id_declarations.append(template_builtin_id_declaration.format(**template_args))
-            template_builtin_id_definition = 'constexpr const TSymbolUniqueId BuiltInId::{human_readable_name};'
-            builtin_id_definitions.append(template_builtin_id_definition.format(**template_args))
-
-            parameters_list = []
-            for param in parameters:
-                unique_param_name = get_variable_name_to_store_parameter(param)
-                param_template_args = {
-                    'name': '_empty',
-                    'name_with_suffix': unique_param_name,
-                    'type': param.get_statictype_string(),
-                    'extension': 'UNDEFINED'
-                }
-                if unique_param_name not in defined_parameter_names:
-                    id_counter += 1
-                    param_template_args['id'] = id_counter
-                    template_builtin_id_declaration = '    static constexpr const TSymbolUniqueId {name_with_suffix} = TSymbolUniqueId({id});'
-                    builtin_id_declarations.append(template_builtin_id_declaration.format(**param_template_args))
-                    define_constexpr_variable(param_template_args)
-                    defined_parameter_names.add(unique_param_name)
-                parameters_list.append('&BuiltInVariable::kVar_{name_with_suffix}'.format(**param_template_args));
-
-            template_args['parameters_var_name'] = get_variable_name_to_store_parameters(parameters)
-            if len(parameters) > 0:
-                template_args['parameters_list'] = ', '.join(parameters_list)
-                template_parameter_list_declaration = 'constexpr const TVariable *{parameters_var_name}[{param_count}] = {{ {parameters_list} }};'
-                parameter_declarations[template_args['parameters_var_name']] = template_parameter_list_declaration.format(**template_args)
-            else:
-                template_parameter_list_declaration = 'constexpr const TVariable **{parameters_var_name} = nullptr;'
-                parameter_declarations[template_args['parameters_var_name']] = template_parameter_list_declaration.format(**template_args)
-
-            template_function_declaration = 'constexpr const TFunction kFunction_{unique_name}(BuiltInId::{human_readable_name}, BuiltInName::{name_with_suffix}, TExtension::{extension}, BuiltInParameters::{parameters_var_name}, {param_count}, {return_type}, EOp{op}, {known_to_not_have_side_effects});'
-            function_declarations.append(template_function_declaration.format(**template_args))
+            defined_function_variants.add(unique_name)
+
+            param_count = len(parameters)
+            return_type = function_variant.return_type.get_statictype_string()
+            mangled_name = get_function_mangled_name(function_name, parameters)
+            human_readable_name = get_function_human_readable_name(name_with_suffix, parameters)
+
+            builtin_id_declarations.append('    static constexpr const TSymbolUniqueId %s = TSymbolUniqueId(%d);' % (human_readable_name, id_counter))
+            builtin_id_definitions.append('constexpr const TSymbolUniqueId BuiltInId::%s;' % human_readable_name)
+
+            # Parameter variables are named after their type, so if this exact list of parameters
+            # already has an array, all of its parameter variables have been declared too.
+            parameters_var_name = get_variable_name_to_store_parameters(parameters)
+            if parameters_var_name not in parameter_declarations:
+                parameters_list = []
+                for param in parameters:
+                    unique_param_name = get_variable_name_to_store_parameter(param)
+                    if unique_param_name not in defined_parameter_names:
+                        id_counter += 1
+                        builtin_id_declarations.append('    static constexpr const TSymbolUniqueId %s = TSymbolUniqueId(%d);' % (unique_param_name, id_counter))
+                        define_constexpr_variable(unique_param_name, '_empty', 'UNDEFINED', param.get_statictype_string())
+                        defined_parameter_names.add(unique_param_name)
+                    parameters_list.append('&BuiltInVariable::kVar_' + unique_param_name)
+
+                if len(parameters) > 0:
+                    parameter_declarations[parameters_var_name] = 'constexpr const TVariable *%s[%d] = { %s };' % (parameters_var_name, param_count, ', '.join(parameters_list))
+                else:
+                    parameter_declarations[parameters_var_name] = 'constexpr const TVariable **%s = nullptr;' % parameters_var_name
+
+            function_declarations.append('constexpr const TFunction kFunction_%s(BuiltInId::%s, BuiltInName::%s, TExtension::%s, BuiltInParameters::%s, %d, %s, EOp%s, %s);' % (
+                unique_name, human_readable_name, name_with_suffix, extension, parameters_var_name, param_count, return_type, op, known_to_not_have_side_effects))
 
             # If we can make sure that there's no other mangled name with the same length, function
             # name and hash, then we can only check the mangled name length and the function name
             # instead of checking the whole mangled name.
-            template_mangled_if = ''
-            if mangled_name_hash_can_collide_with_different_parameters(template_args):
-                template_mangled_name_declaration = 'constexpr const ImmutableString {unique_name}("{mangled_name}");'
-                name_declarations.add(template_mangled_name_declaration.format(**template_args))
-                template_mangled_if = """if (name == BuiltInName::{unique_name})
-{{
-    return &BuiltInFunction::kFunction_{unique_name};
-}}"""
+            if mangled_name_hash_can_collide_with_different_parameters(function_name, mangled_name):
+                name_declarations[unique_name] = 'constexpr const ImmutableString %s("%s");' % (unique_name, mangled_name)
+                mangled_if = """if (name == BuiltInName::%s)
+{
+    return &BuiltInFunction::kFunction_%s;
+}""" % (unique_name, unique_name)
             else:
-                template_mangled_if = """if (name.beginsWith(BuiltInName::{name_with_suffix}))
-{{
-    ASSERT(name.length() == {mangled_name_length});
-    return &BuiltInFunction::kFunction_{unique_name};
-}}"""
-            mangled_if = template_mangled_if.format(**template_args)
-            get_builtin_if_statements.add_obj(level, condition, template_args['mangled_name'], {'hash_matched_code': mangled_if})
+                mangled_if = """if (name.beginsWith(BuiltInName::%s))
+{
+    ASSERT(name.length() == %d);
+    return &BuiltInFunction::kFunction_%s;
+}""" % (name_with_suffix, len(mangled_name), unique_name)
+            get_builtin_if_statements.add_obj(level, condition, mangled_name, {'hash_matched_code': mangled_if})
 
             id_counter += 1
 
@@ -1052,7 +1122,7 @@ def process_function_group(group_name, group):
     process_single_function_group(condition, group_name, group)
 
     if 'subgroups' in group:
-        for subgroup_name, subgroup in group['subgroups'].iteritems():
+        for subgroup_name, subgroup in group['subgroups'].items():
             process_function_group(group_name + subgroup_name, subgroup)
 
     if 'queryFunction' in group:
@@ -1068,15 +1138,17 @@ def process_function_group(group_name, group):
 }}"""
         is_in_group_definitions.append(template_is_in_group_definition.format(**template_args))
 
-for group_name, group in parsed_functions.iteritems():
+for group_name, group in parsed_functions.items():
     process_function_group(group_name, group)
 
 def prune_parameters_arrays():
     # We can share parameters arrays between functions in case one array is a subarray of another.
     global parameter_declarations
     parameter_variable_name_replacements = {}
-    used_param_variable_names = set()
-    for param_variable_name, param_declaration in sorted(parameter_declarations.iteritems(), key=lambda item: -len(item[0])):
+    # Keep the used names in a list and break ties in length by name so that the result doesn't
+    # depend on hash ordering.
+    used_param_variable_names = []
+    for param_variable_name, param_declaration in sorted(parameter_declarations.items(), key=lambda item: (-len(item[0]), item[0])):
         replaced = False
         for used in used_param_variable_names:
             if used.startswith(param_variable_name):
@@ -1084,11 +1156,11 @@ def prune_parameters_arrays():
                 replaced = True
                 break
         if not replaced:
-            used_param_variable_names.add(param_variable_name)
-    parameter_declarations = [value for key, value in parameter_declarations.iteritems() if key in used_param_variable_names]
+            used_param_variable_names.append(param_variable_name)
+    parameter_declarations = [value for key, value in parameter_declarations.items() if key in used_param_variable_names]
 
-    for i in xrange(len(function_declarations)):
-        for replaced, replacement in parameter_variable_name_replacements.iteritems():
+    for i in range(len(function_declarations)):
+        for replaced, replacement in parameter_variable_name_replacements.items():
             function_declarations[i] = function_declarations[i].replace('BuiltInParameters::' + replaced + ',', 'BuiltInParameters::' + replacement + ',')
 prune_parameters_arrays()
 
@@ -1096,7 +1168,7 @@ def process_single_variable_group(condition, group_name, group):
     global id_counter
     if 'variables' not in group:
         return
-    for variable_name, props in group['variables'].iteritems():
+    for variable_name, props in group['variables'].items():
         level = props['level']
         template_args = {
             'id': id_counter,
@@ -1107,13 +1179,12 @@ def process_single_variable_group(condition, group_name, group):
             'class': 'TVariable'
         }
 
-        template_builtin_id_declaration = '    static constexpr const TSymbolUniqueId {name_with_suffix} = TSymbolUniqueId({id});'
-        builtin_id_declarations.append(template_builtin_id_declaration.format(**template_args))
-        template_builtin_id_definition = 'constexpr const TSymbolUniqueId BuiltInId::{name_with_suffix};'
-        builtin_id_definitions.append(template_builtin_id_definition.format(**template_args))
+        builtin_id_declarations.append('    static constexpr const TSymbolUniqueId %s = TSymbolUniqueId(%d);' % (template_args['name_with_suffix'], id_counter))
+        builtin_id_definitions.append('constexpr const TSymbolUniqueId BuiltInId::%s;' % template_args['name_with_suffix'])
 
-        template_name_declaration = 'constexpr const ImmutableString {name}("{name}");'
-        name_declarations.add(template_name_declaration.format(**template_args))
+        if variable_name not in name_declarations:
+            template_name_declaration = 'constexpr const ImmutableString {name}("{name}");'
+            name_declarations[variable_name] = template_name_declaration.format(**template_args)
 
         is_member = True
         template_init_variable = ''
@@ -1128,11 +1199,12 @@ def process_single_variable_group(condition, group_name, group):
             template_args['class'] = props['class']
             template_args['fields'] = 'fields_{name_with_suffix}'.format(**template_args)
             init_member_variables.append('    TFieldList *{fields} = new TFieldList();'.format(**template_args))
-            for field_name, field_type in props['fields'].iteritems():
+            for field_name, field_type in props['fields'].items():
                 template_args['field_name'] = field_name
                 template_args['field_type'] = TType(field_type).get_dynamic_type_string()
-                template_name_declaration = 'constexpr const ImmutableString {field_name}("{field_name}");'
-                name_declarations.add(template_name_declaration.format(**template_args))
+                if field_name not in name_declarations:
+                    template_name_declaration = 'constexpr const ImmutableString {field_name}("{field_name}");'
+                    name_declarations[field_name] = template_name_declaration.format(**template_args)
                 template_add_field = '    {fields}->push_back(new TField({field_type}, BuiltInName::{field_name}, zeroSourceLoc));'
                 init_member_variables.append(template_add_field.format(**template_args))
             template_init_temp_variable = '    {class} *{name_with_suffix} = new {class}(BuiltInId::{name_with_suffix}, BuiltInName::{name}, TExtension::{extension}, {fields});'
@@ -1181,7 +1253,7 @@ def process_single_variable_group(condition, group_name, group):
         else:
             # Handle variables that can be stored as constexpr TVariable like
             # gl_Position, gl_FragColor etc.
-            define_constexpr_variable(template_args)
+            define_constexpr_variable(template_args['name_with_suffix'], variable_name, template_args['extension'], template_args['type'])
             is_member = False
 
             template_get_variable_declaration = 'const TVariable *{name_with_suffix}();'
@@ -1231,13 +1303,13 @@ def process_single_variable_group(condition, group_name, group):
 
 def count_variable_names(group):
     if 'variables' in group:
-        for name in group['variables'].iterkeys():
+        for name in group['variables']:
             if name not in variable_name_count:
                 variable_name_count[name] = 1
             else:
                 variable_name_count[name] += 1
     if 'subgroups' in group:
-        for subgroup_name, subgroup in group['subgroups'].iteritems():
+        for subgroup_name, subgroup in group['subgroups'].items():
             count_variable_names(subgroup)
 
 def process_variable_group(parent_condition, group_name, group):
@@ -1254,13 +1326,13 @@ def process_variable_group(parent_condition, group_name, group):
     process_single_variable_group(condition, group_name, group)
 
     if 'subgroups' in group:
-        for subgroup_name, subgroup in group['subgroups'].iteritems():
+        for subgroup_name, subgroup in group['subgroups'].items():
             process_variable_group(condition, subgroup_name, subgroup)
 
-for group_name, group in parsed_variables.iteritems():
+for group_name, group in parsed_variables.items():
     count_variable_names(group)
 
-for group_name, group in parsed_variables.iteritems():
+for group_name, group in parsed_variables.items():
     process_variable_group('NO_CONDITION', group_name, group)
 
 output_strings = {
@@ -1268,52 +1340,109 @@ output_strings = {
     'copyright_year': date.today().year,
 
     'builtin_id_declarations': '\n'.join(builtin_id_declarations),
-    'builtin_id_definitions': '\n'.join(builtin_id_definitions),
     'last_builtin_id': id_counter - 1,
-    'name_declarations': '\n'.join(sorted(list(name_declarations))),
 
     'function_data_source_name': functions_txt_filename,
-    'function_declarations': '\n'.join(function_declarations),
-    'parameter_declarations': '\n'.join(sorted(parameter_declarations)),
 
     'is_in_group_definitions': '\n'.join(is_in_group_definitions),
 
     'variable_data_source_name': variables_json_filename,
-    'variable_declarations': '\n'.join(sorted(variable_declarations)),
     'get_variable_declarations': '\n'.join(sorted(get_variable_declarations)),
-    'get_variable_definitions': '\n'.join(sorted(get_variable_definitions)),
-    'unmangled_builtin_declarations': '\n'.join(sorted(unmangled_builtin_declarations)),
 
     'declare_member_variables': '\n'.join(declare_member_variables),
-    'init_member_variables': '\n'.join(init_member_variables),
 
-    'get_unmangled_builtin': unmangled_function_if_statements.get_switch_code(),
-    'get_builtin': get_builtin_if_statements.get_switch_code(),
     'max_unmangled_name_length': unmangled_function_if_statements.get_max_name_length(),
     'max_mangled_name_length': get_builtin_if_statements.get_max_name_length(),
-
-    'script_generated_hash_tests': '\n'.join(script_generated_hash_tests.iterkeys())
 }
 
-with open('../../tests/compiler_tests/ImmutableString_test_autogen.cpp', 'wt') as outfile_cpp:
-    output_cpp = template_immutablestringtest_cpp.format(**output_strings)
-    outfile_cpp.write(output_cpp)
+# Sections that are only used in SymbolTable_autogen.cpp or ImmutableString_test_autogen.cpp are kept
+# as lists of lines and passed only to write_template(), which writes them out line by line.
+output_line_lists = {
+    'builtin_id_definitions': builtin_id_definitions,
+    'name_declarations': sorted(name_declarations.values()),
+
+    'function_declarations': function_declarations,
+    'parameter_declarations': sorted(parameter_declarations),
+
+    'variable_declarations': sorted(variable_declarations),
+    'get_variable_definitions': sorted(get_variable_definitions),
+    'unmangled_builtin_declarations': sorted(unmangled_builtin_declarations.values()),
 
-with open('tree_util/BuiltIn_autogen.h', 'wt') as outfile_header:
-    output_header = template_builtin_header.format(**output_strings)
-    outfile_header.write(output_header)
+    'init_member_variables': init_member_variables,
 
-with open('SymbolTable_autogen.cpp', 'wt') as outfile_cpp:
-    output_cpp = template_symboltable_cpp.format(**output_strings)
-    outfile_cpp.write(output_cpp)
+    'get_unmangled_builtin': unmangled_function_if_statements.get_switch_code(),
+    'get_builtin': get_builtin_if_statements.get_switch_code(),
 
-with open('ParseContext_autogen.h', 'wt') as outfile_header:
-    output_header = template_parsecontext_header.format(**output_strings)
-    outfile_header.write(output_header)
+    'script_generated_hash_tests': get_script_generated_hash_tests()
+}
 
-with open('SymbolTable_autogen.h', 'wt') as outfile_h:
-    output_h = template_symboltable_h.format(**output_strings)
-    outfile_h.write(output_h)
+output_renderers = [
+    (immutablestring_test_filename,
+        lambda write: write_template(write, template_immutablestringtest_cpp, output_strings, output_line_lists)),
+    (builtin_header_filename,
+        lambda write: write(template_builtin_header.format(**output_strings))),
+    (symboltable_cpp_filename,
+        lambda write: write_template(write, template_symboltable_cpp, output_strings, output_line_lists)),
+    (parsecontext_header_filename,
+        lambda write: write(template_parsecontext_header.format(**output_strings))),
+    (symboltable_h_filename,
+        lambda write: write(template_symboltable_h.format(**output_strings))),
+]
+
+# The checked-in outputs are clang-formatted after generation, so they can't be compared with the
+# raw output of this script. Instead, the hash of each output's raw text is stored in
+# output_hash_filename, and an output is only replaced when its hash changes. Unchanged outputs keep
+# their timestamps, so the code that depends on them isn't recompiled. The copyright year is left
+# out of the hashes, since it changes every year without the outputs changing.
+# Note that this trusts the files on disk to still match the stored hashes: an output that has been
+# edited by hand is only regenerated once its hash changes or it is deleted, just like when the
+# input hash above matches.
+stored_output_hashes = {}
+if os.path.exists(output_hash_filename):
+    with open(output_hash_filename) as output_hash_file:
+        try:
+            stored_output_hashes = json.load(output_hash_file)
+        except ValueError:
+            pass
+
+copyright_notice = 'Copyright %s ' % output_strings['copyright_year']
+
+def write_output(output_path, render_output):
+    # The output is written to a temporary file and hashed at the same time. The temporary file only
+    # replaces the existing output if the hash differs from the stored one.
+    m = hashlib.md5()
+    temp_path = output_path + '.tmp'
+    try:
+        with open(temp_path, 'wt') as outfile:
+            def write(text):
+                outfile.write(text)
+                m.update(text.replace(copyright_notice, 'Copyright ').encode('ascii'))
+            render_output(write)
+        output_hash = m.hexdigest()
+        if output_hash == stored_output_hashes.get(output_path) and os.path.exists(output_path):
+            return output_hash
+        if hasattr(os, 'replace'):
+            os.replace(temp_path, output_path)
+        else:
+            # Python 2 doesn't have os.replace, and os.rename can't overwrite files on Windows.
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            os.rename(temp_path, output_path)
+        print("Updated " + output_path)
+        return output_hash
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+output_hashes = OrderedDict()
+for output_path, render_output in output_renderers:
+    output_hashes[output_path] = write_output(output_path, render_output)
+
+# The hash files are always rewritten, so that they are newer than the inputs even when none of the
+# outputs changed. run_code_generation.py checks their timestamps instead of the outputs'.
+with open(output_hash_filename, 'wt') as output_hash_file:
+    json.dump(output_hashes, output_hash_file, indent=4, separators=(',', ': '))
+    output_hash_file.write('\n')
 
 with open(hash_filename, 'wt') as hash_file:
     hash_file.write(input_hash)
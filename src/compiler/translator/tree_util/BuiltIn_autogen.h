@@ -1170,33 +1170,33 @@ class BuiltInId
     static constexpr const TSymbolUniqueId pt0m                             = TSymbolUniqueId(892);
     static constexpr const TSymbolUniqueId imageSize_UImageCube1            = TSymbolUniqueId(893);
     static constexpr const TSymbolUniqueId pt0n                             = TSymbolUniqueId(894);
-    static constexpr const TSymbolUniqueId imageLoad_Image2D1_Int2          = TSymbolUniqueId(895);
-    static constexpr const TSymbolUniqueId imageLoad_IImage2D1_Int2         = TSymbolUniqueId(896);
-    static constexpr const TSymbolUniqueId imageLoad_UImage2D1_Int2         = TSymbolUniqueId(897);
-    static constexpr const TSymbolUniqueId imageLoad_Image3D1_Int3          = TSymbolUniqueId(898);
-    static constexpr const TSymbolUniqueId imageLoad_IImage3D1_Int3         = TSymbolUniqueId(899);
-    static constexpr const TSymbolUniqueId imageLoad_UImage3D1_Int3         = TSymbolUniqueId(900);
-    static constexpr const TSymbolUniqueId imageLoad_Image2DArray1_Int3     = TSymbolUniqueId(901);
-    static constexpr const TSymbolUniqueId imageLoad_IImage2DArray1_Int3    = TSymbolUniqueId(902);
-    static constexpr const TSymbolUniqueId imageLoad_UImage2DArray1_Int3    = TSymbolUniqueId(903);
-    static constexpr const TSymbolUniqueId imageLoad_ImageCube1_Int3        = TSymbolUniqueId(904);
-    static constexpr const TSymbolUniqueId imageLoad_IImageCube1_Int3       = TSymbolUniqueId(905);
-    static constexpr const TSymbolUniqueId imageLoad_UImageCube1_Int3       = TSymbolUniqueId(906);
-    static constexpr const TSymbolUniqueId imageStore_Image2D1_Int2_Float4  = TSymbolUniqueId(907);
-    static constexpr const TSymbolUniqueId imageStore_IImage2D1_Int2_Int4   = TSymbolUniqueId(908);
-    static constexpr const TSymbolUniqueId imageStore_UImage2D1_Int2_UInt4  = TSymbolUniqueId(909);
-    static constexpr const TSymbolUniqueId imageStore_Image3D1_Int3_Float4  = TSymbolUniqueId(910);
-    static constexpr const TSymbolUniqueId imageStore_IImage3D1_Int3_Int4   = TSymbolUniqueId(911);
-    static constexpr const TSymbolUniqueId imageStore_UImage3D1_Int3_UInt4  = TSymbolUniqueId(912);
+    static constexpr const TSymbolUniqueId imageStore_Image2D1_Int2_Float4  = TSymbolUniqueId(895);
+    static constexpr const TSymbolUniqueId imageStore_IImage2D1_Int2_Int4   = TSymbolUniqueId(896);
+    static constexpr const TSymbolUniqueId imageStore_UImage2D1_Int2_UInt4  = TSymbolUniqueId(897);
+    static constexpr const TSymbolUniqueId imageStore_Image3D1_Int3_Float4  = TSymbolUniqueId(898);
+    static constexpr const TSymbolUniqueId imageStore_IImage3D1_Int3_Int4   = TSymbolUniqueId(899);
+    static constexpr const TSymbolUniqueId imageStore_UImage3D1_Int3_UInt4  = TSymbolUniqueId(900);
     static constexpr const TSymbolUniqueId imageStore_Image2DArray1_Int3_Float4 =
-        TSymbolUniqueId(913);
+        TSymbolUniqueId(901);
     static constexpr const TSymbolUniqueId imageStore_IImage2DArray1_Int3_Int4 =
-        TSymbolUniqueId(914);
+        TSymbolUniqueId(902);
     static constexpr const TSymbolUniqueId imageStore_UImage2DArray1_Int3_UInt4 =
-        TSymbolUniqueId(915);
-    static constexpr const TSymbolUniqueId imageStore_ImageCube1_Int3_Float4 = TSymbolUniqueId(916);
-    static constexpr const TSymbolUniqueId imageStore_IImageCube1_Int3_Int4  = TSymbolUniqueId(917);
-    static constexpr const TSymbolUniqueId imageStore_UImageCube1_Int3_UInt4 = TSymbolUniqueId(918);
+        TSymbolUniqueId(903);
+    static constexpr const TSymbolUniqueId imageStore_ImageCube1_Int3_Float4 = TSymbolUniqueId(904);
+    static constexpr const TSymbolUniqueId imageStore_IImageCube1_Int3_Int4  = TSymbolUniqueId(905);
+    static constexpr const TSymbolUniqueId imageStore_UImageCube1_Int3_UInt4 = TSymbolUniqueId(906);
+    static constexpr const TSymbolUniqueId imageLoad_Image2D1_Int2           = TSymbolUniqueId(907);
+    static constexpr const TSymbolUniqueId imageLoad_IImage2D1_Int2          = TSymbolUniqueId(908);
+    static constexpr const TSymbolUniqueId imageLoad_UImage2D1_Int2          = TSymbolUniqueId(909);
+    static constexpr const TSymbolUniqueId imageLoad_Image3D1_Int3           = TSymbolUniqueId(910);
+    static constexpr const TSymbolUniqueId imageLoad_IImage3D1_Int3          = TSymbolUniqueId(911);
+    static constexpr const TSymbolUniqueId imageLoad_UImage3D1_Int3          = TSymbolUniqueId(912);
+    static constexpr const TSymbolUniqueId imageLoad_Image2DArray1_Int3      = TSymbolUniqueId(913);
+    static constexpr const TSymbolUniqueId imageLoad_IImage2DArray1_Int3     = TSymbolUniqueId(914);
+    static constexpr const TSymbolUniqueId imageLoad_UImage2DArray1_Int3     = TSymbolUniqueId(915);
+    static constexpr const TSymbolUniqueId imageLoad_ImageCube1_Int3         = TSymbolUniqueId(916);
+    static constexpr const TSymbolUniqueId imageLoad_IImageCube1_Int3        = TSymbolUniqueId(917);
+    static constexpr const TSymbolUniqueId imageLoad_UImageCube1_Int3        = TSymbolUniqueId(918);
     static constexpr const TSymbolUniqueId memoryBarrier                     = TSymbolUniqueId(919);
     static constexpr const TSymbolUniqueId memoryBarrierAtomicCounter        = TSymbolUniqueId(920);
     static constexpr const TSymbolUniqueId memoryBarrierBuffer               = TSymbolUniqueId(921);
@@ -826,18 +826,6 @@ TEST(ImmutableStringTest, ScriptGeneratedHashesMatch)
     ASSERT_EQ(0x12660ccfu, ImmutableString("imageSize(0l").mangledNameHash());
     ASSERT_EQ(0x12661578u, ImmutableString("imageSize(0m").mangledNameHash());
     ASSERT_EQ(0x12661be5u, ImmutableString("imageSize(0n").mangledNameHash());
-    ASSERT_EQ(0x12737e4du, ImmutableString("imageLoad(0c1C").mangledNameHash());
-    ASSERT_EQ(0x1273b8c5u, ImmutableString("imageLoad(0d1C").mangledNameHash());
-    ASSERT_EQ(0x12754b32u, ImmutableString("imageLoad(0e1C").mangledNameHash());
-    ASSERT_EQ(0x1274d104u, ImmutableString("imageLoad(0f2C").mangledNameHash());
-    ASSERT_EQ(0x12701a06u, ImmutableString("imageLoad(0g2C").mangledNameHash());
-    ASSERT_EQ(0x1270829bu, ImmutableString("imageLoad(0h2C").mangledNameHash());
-    ASSERT_EQ(0x127539b2u, ImmutableString("imageLoad(0i2C").mangledNameHash());
-    ASSERT_EQ(0x12715f47u, ImmutableString("imageLoad(0j2C").mangledNameHash());
-    ASSERT_EQ(0x127474cau, ImmutableString("imageLoad(0k2C").mangledNameHash());
-    ASSERT_EQ(0x1276656cu, ImmutableString("imageLoad(0l2C").mangledNameHash());
-    ASSERT_EQ(0x12731984u, ImmutableString("imageLoad(0m2C").mangledNameHash());
-    ASSERT_EQ(0x12712664u, ImmutableString("imageLoad(0n2C").mangledNameHash());
     ASSERT_EQ(0x148d6aebu, ImmutableString("imageStore(0c1C3B").mangledNameHash());
     ASSERT_EQ(0x148aca44u, ImmutableString("imageStore(0d1C3C").mangledNameHash());
     ASSERT_EQ(0x148f334cu, ImmutableString("imageStore(0e1C3D").mangledNameHash());
@@ -850,6 +838,18 @@ TEST(ImmutableStringTest, ScriptGeneratedHashesMatch)
     ASSERT_EQ(0x148dcfd5u, ImmutableString("imageStore(0l2C3B").mangledNameHash());
     ASSERT_EQ(0x148e37b8u, ImmutableString("imageStore(0m2C3C").mangledNameHash());
     ASSERT_EQ(0x148ed534u, ImmutableString("imageStore(0n2C3D").mangledNameHash());
+    ASSERT_EQ(0x12737e4du, ImmutableString("imageLoad(0c1C").mangledNameHash());
+    ASSERT_EQ(0x1273b8c5u, ImmutableString("imageLoad(0d1C").mangledNameHash());
+    ASSERT_EQ(0x12754b32u, ImmutableString("imageLoad(0e1C").mangledNameHash());
+    ASSERT_EQ(0x1274d104u, ImmutableString("imageLoad(0f2C").mangledNameHash());
+    ASSERT_EQ(0x12701a06u, ImmutableString("imageLoad(0g2C").mangledNameHash());
+    ASSERT_EQ(0x1270829bu, ImmutableString("imageLoad(0h2C").mangledNameHash());
+    ASSERT_EQ(0x127539b2u, ImmutableString("imageLoad(0i2C").mangledNameHash());
+    ASSERT_EQ(0x12715f47u, ImmutableString("imageLoad(0j2C").mangledNameHash());
+    ASSERT_EQ(0x127474cau, ImmutableString("imageLoad(0k2C").mangledNameHash());
+    ASSERT_EQ(0x1276656cu, ImmutableString("imageLoad(0l2C").mangledNameHash());
+    ASSERT_EQ(0x12731984u, ImmutableString("imageLoad(0m2C").mangledNameHash());
+    ASSERT_EQ(0x12712664u, ImmutableString("imageLoad(0n2C").mangledNameHash());
     ASSERT_EQ(0x1a7538dfu, ImmutableString("memoryBarrier(").mangledNameHash());
     ASSERT_EQ(0x34ded18du, ImmutableString("memoryBarrierAtomicCounter(").mangledNameHash());
     ASSERT_EQ(0x26a7e24bu, ImmutableString("memoryBarrierBuffer(").mangledNameHash());
@@ -890,8 +890,8 @@ TEST(ImmutableStringTest, ScriptGeneratedHashesMatch)
     ASSERT_EQ(0x7e75cfb1u, ImmutableString("atomicExchange").mangledNameHash());
     ASSERT_EQ(0x7e778ffcu, ImmutableString("atomicCompSwap").mangledNameHash());
     ASSERT_EQ(0x7e4b6656u, ImmutableString("imageSize").mangledNameHash());
-    ASSERT_EQ(0x7e4a45b6u, ImmutableString("imageLoad").mangledNameHash());
     ASSERT_EQ(0x7e5276efu, ImmutableString("imageStore").mangledNameHash());
+    ASSERT_EQ(0x7e4a45b6u, ImmutableString("imageLoad").mangledNameHash());
     ASSERT_EQ(0x7e69d0dbu, ImmutableString("memoryBarrier").mangledNameHash());
     ASSERT_EQ(0x7ed5b06bu, ImmutableString("memoryBarrierAtomicCounter").mangledNameHash());
     ASSERT_EQ(0x7e9b7f32u, ImmutableString("memoryBarrierBuffer").mangledNameHash());